@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """
 Build script for creating a standalone executable of SBS EXR Converter.
-This creates a single .exe file that includes all dependencies.
+This creates a dist/SBS-EXR-Converter folder containing the .exe and all
+of its dependencies.
 
 Usage:
     python build_executable.py
@@ -36,15 +37,29 @@ def build_executable():
     # PyInstaller command
     cmd = [
         "pyinstaller",
-        "--onefile",                    # Single executable file
+        "--onedir",                     # Folder build: no unpacking on every launch
+        "--noupx",                      # UPX-compressed binaries start slower
+        "--noconfirm",                  # Overwrite dist/ but keep build/ (no --clean) so
+                                        # rebuilds reuse PyInstaller's analysis cache
         "--windowed",                   # No console window
         "--name=SBS-EXR-Converter",     # Output name
         "--icon=icon.ico",              # Icon (if available)
         "--add-data=requirements.txt;.", # Include requirements
         "--hidden-import=tkinter",      # Ensure tkinter is included
         "--hidden-import=tkinter.ttk",  # Ensure ttk is included
+        # Not needed at runtime; keeps the bundle small. numpy stays, the
+        # optional OpenImageIO bindings depend on it.
+        "--exclude-module=matplotlib",
+        "--exclude-module=PIL",
+        "--exclude-module=pytest",
+        "--exclude-module=unittest",
+        "--exclude-module=test",
         "sbs_gui.py"                    # Main script
     ]
+
+    # Strip symbols from bundled binaries (no strip tool on Windows)
+    if sys.platform != "win32":
+        cmd.insert(1, "--strip")
     
     # Remove icon parameter if icon doesn't exist
     if not os.path.exists("icon.ico"):
@@ -53,8 +68,8 @@ def build_executable():
     try:
         subprocess.check_call(cmd)
         print("✅ Build successful!")
-        print(f"📁 Executable created: dist/SBS-EXR-Converter.exe")
-        print("\n🎉 You can now distribute the .exe file to users!")
+        print(f"📁 Executable created: dist/SBS-EXR-Converter/SBS-EXR-Converter.exe")
+        print("\n🎉 You can now distribute the dist/SBS-EXR-Converter folder to users!")
         print("   No Python installation required on target machines.")
         
     except subprocess.CalledProcessError as e:
@@ -73,7 +88,7 @@ echo.
 echo Installing to Program Files...
 if not exist "C:\\Program Files\\SBS-EXR-Converter" mkdir "C:\\Program Files\\SBS-EXR-Converter"
 
-copy "SBS-EXR-Converter.exe" "C:\\Program Files\\SBS-EXR-Converter\\"
+xcopy /E /I /Y "SBS-EXR-Converter" "C:\\Program Files\\SBS-EXR-Converter"
 copy "README.md" "C:\\Program Files\\SBS-EXR-Converter\\"
 copy "SETUP_GUIDE.md" "C:\\Program Files\\SBS-EXR-Converter\\"
 
@@ -107,7 +122,7 @@ def main():
         create_installer_script()
         print("\n📦 Distribution package ready!")
         print("   Files to distribute:")
-        print("   - dist/SBS-EXR-Converter.exe")
+        print("   - dist/SBS-EXR-Converter/ (whole folder)")
         print("   - install.bat")
         print("   - README.md")
         print("   - SETUP_GUIDE.md")
@@ -1,36 +1,202 @@
 """Tkinter-based tool for converting EXR sequences to SBS."""
 
+import hashlib
 import os
 import subprocess
 import threading
 import queue
+import re
 import tempfile
 import shutil
+import struct
 import sys
 import time
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
+from collections import OrderedDict, deque
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import List, Dict
+from functools import lru_cache
+from typing import Dict, Iterator, List, Set
 import urllib.request
 import zipfile
 import platform
 import json
-import random
 import webbrowser
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 
 try:
     import psutil
 except ImportError:  # pragma: no cover - optional dependency
     psutil = None
 
+try:
+    import OpenImageIO as oiio
+except ImportError:  # pragma: no cover - optional dependency
+    oiio = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover - optional dependency
+    Observer = None
+
+# EXR frames are written as .exr or .EXR; a tuple lets str.endswith check
+# both without lowercasing every name.
+EXR_SUFFIXES = (".exr", ".EXR")
+
+# File kinds returned by _classify().
+NOT_EXR, SOURCE_FRAME, SBS_FRAME = 0, 1, 2
+
+# Marks outputs that are still being written; renamed away on success.
+PART_TAG = ".part"
+
+# Where finished SBS shots are moved to unless another folder is chosen.
+DEFAULT_READY_FOR_COMP = r"D:\Boona Dropbox\Boona Slate\01_Active\Silver_SIL_JUL25_BS-144\Production\Output\Silver - Renders\Unreal Renders\ReadyForComp"
+
+# Per-user settings remembered between launches (e.g. where oiiotool is).
+CONFIG_FILE = os.path.join(os.path.expanduser("~"), ".exr_sbs_converter", "config.json")
+CONFIG_SCHEMA_VERSION = 1
+
+# Maximum number of frames converted by a single oiiotool process.
+FRAMES_PER_BATCH = 16
+
+# Lines kept in the log window; older lines are dropped.
+LOG_MAX_LINES = 5000
+
+# Thumbnails are decimated rather than filtered: --resample just picks
+# pixels, where --resize runs a wide filter over the full-size frame.
+THUMBNAIL_SIZE = 200
+THUMBNAIL_ARGS = ("--resample", f"{THUMBNAIL_SIZE}x{THUMBNAIL_SIZE}")
+
+# Rendered thumbnails kept on disk between launches, least recently used
+# pruned beyond the size limit at startup.
+THUMBNAIL_CACHE_DIR = os.path.join(os.path.dirname(CONFIG_FILE), "thumbs")
+THUMBNAIL_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+# Delay before a shot selection starts rendering its preview.
+PREVIEW_DEBOUNCE_MS = 150
+
+# Decoded thumbnails (Tk images) kept for recently previewed frames.
+THUMBNAIL_CACHE_SIZE = 32
+
+# Minimum seconds between progress messages sent from the conversion worker.
+PROGRESS_INTERVAL = 0.1
+
+# Seconds a cached frame count may be reused even if the folder's mtime
+# hasn't changed.
+DIR_CACHE_TTL = 60.0
+
+# Maximum threads used to count frames across shot folders during a scan.
+SCAN_WORKERS = 32
+
+# Seconds between live-mode checks, and the quiet time after a file change
+# before live mode rescans (renders write frames in bursts).
+LIVE_MODE_INTERVAL = 15
+LIVE_MODE_DEBOUNCE = 2.0
+
+# Internal threads each oiiotool process may use (OPENIMAGEIO_THREADS).
+OIIO_THREADS_PER_JOB = 2
+
+# Share of physical RAM split between the parallel jobs' image caches.
+IMAGECACHE_RAM_FRACTION = 0.25
+
+if oiio is not None:
+    # Same cap for in-process conversions as OPENIMAGEIO_THREADS gives oiiotool.
+    oiio.attribute("threads", OIIO_THREADS_PER_JOB)
+
+
+def default_worker_count() -> int:
+    """Default number of parallel oiiotool jobs.
+
+    oiiotool is multithreaded itself, so rather than one job per logical CPU
+    run one job per ``OIIO_THREADS_PER_JOB`` physical cores.
+    """
+    physical = psutil.cpu_count(logical=False) if psutil else None
+    if not physical:
+        physical = (os.cpu_count() or 2) // 2
+    return max(1, physical // OIIO_THREADS_PER_JOB)
+
+
+def total_memory_mb() -> int | None:
+    """Physical memory in MiB, or ``None`` if it can't be determined."""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        pass
+    if psutil:
+        return psutil.virtual_memory().total // (1024 * 1024)
+    return None
+
+
+def _load_cached_oiiotool() -> str | None:
+    """The oiiotool path saved by a previous launch, if it's still valid.
+
+    The saved path is only trusted while it is still executable and its
+    mtime matches the one recorded with it.
+    """
+    try:
+        with open(CONFIG_FILE, "rb") as f:
+            config = json.loads(f.read())
+        if config.get("schema_version") != CONFIG_SCHEMA_VERSION:
+            return None
+        path = config["oiiotool"]
+        if os.stat(path).st_mtime_ns == config["oiiotool_mtime_ns"] and os.access(path, os.X_OK):
+            return path
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+    return None
 
-def find_oiiotool() -> str | None:
+
+def _save_cached_oiiotool(path: str) -> None:
+    """Remember ``path`` so the next launch can skip the search."""
+    try:
+        config = {
+            "schema_version": CONFIG_SCHEMA_VERSION,
+            "oiiotool": path,
+            "oiiotool_mtime_ns": os.stat(path).st_mtime_ns,
+        }
+        os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
+        temp_file = CONFIG_FILE + PART_TAG
+        with open(temp_file, "w") as f:
+            json.dump(config, f)
+        os.replace(temp_file, CONFIG_FILE)
+    except OSError:
+        pass  # only an optimisation
+
+
+@lru_cache(maxsize=None)
+def find_oiiotool(use_saved: bool = True) -> str | None:
     """Search common locations and PATH for ``oiiotool``.
 
-    Returns the full path to the executable or ``None`` if not found.
+    Returns the full path to the executable or ``None`` if not found. The
+    result is cached; call ``find_oiiotool.cache_clear()`` to search again.
+    A path found by an earlier launch is reused while it's unchanged,
+    unless ``use_saved`` is false.
     """
+    if use_saved:
+        cached = _load_cached_oiiotool()
+        if cached:
+            return cached
+    found = _search_oiiotool()
+    if found:
+        _save_cached_oiiotool(found)
+    else:
+        try:
+            os.remove(CONFIG_FILE)  # don't fall back to a stale path later
+        except OSError:
+            pass
+    return found
+
+
+def _search_oiiotool() -> str | None:
+    """Look for ``oiiotool`` on PATH, next to the app, in vcpkg and Program Files."""
     for name in ("oiiotool", "oiiotool.exe"):
         exe = shutil.which(name)
         if exe:
@@ -43,10 +209,9 @@ def find_oiiotool() -> str | None:
 
     # Search vcpkg installation directory
     vcpkg_path = os.path.join(os.path.expanduser("~"), "vcpkg", "installed")
-    if os.path.exists(vcpkg_path):
-        for root, dirs, files in os.walk(vcpkg_path):
-            if "oiiotool.exe" in files:
-                return os.path.join(root, "oiiotool.exe")
+    found = _find_in_vcpkg(vcpkg_path)
+    if found:
+        return found
 
     program_files = os.environ.get("PROGRAMFILES", "")
     program_files_x86 = os.environ.get("PROGRAMFILES(X86)", "")
@@ -66,6 +231,417 @@ def find_oiiotool() -> str | None:
     return None
 
 
+def _find_in_vcpkg(installed: str) -> str | None:
+    """Look for ``oiiotool.exe`` where vcpkg installs it.
+
+    vcpkg puts tools in ``installed/<triplet>/tools/<port>/``, so only the
+    triplet folders are listed instead of walking the whole tree. The
+    usual ``x64-windows`` triplet is tried first.
+    """
+    try:
+        with os.scandir(installed) as it:
+            triplets = sorted(
+                (entry.name for entry in it if entry.is_dir() and entry.name != "vcpkg"),
+                key=lambda name: name != "x64-windows",
+            )
+    except OSError:
+        return None
+    for triplet in triplets:
+        path = os.path.join(installed, triplet, "tools", "openimageio", "oiiotool.exe")
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def convert_frame_oiio(src: str, dst: str, datatype: str, compression: str) -> str:
+    """Convert one frame in-process with the OpenImageIO Python bindings.
+
+    Equivalent to ``oiiotool src --fullpixels -d <datatype> --compression
+    <compression> -o dst``. Returns an error message, or ``""`` on success.
+    """
+    buf = oiio.ImageBuf(src)
+    roi = buf.roi
+    buf.set_full(roi.xbegin, roi.xend, roi.ybegin, roi.yend, roi.zbegin, roi.zend)
+    buf.specmod().attribute("compression", compression)
+    buf.set_write_format(oiio.TypeDesc(datatype))
+    if not buf.write(dst):
+        return buf.geterror() or f"Failed to write {dst}"
+    return ""
+
+
+def configure_oiio_cache(max_memory_mb: int) -> None:
+    """Size the shared ImageCache used by ``convert_frame_oiio``.
+
+    Older and newer bindings expose the shared cache differently; if
+    neither form works the library default is kept.
+    """
+    try:
+        if hasattr(oiio.ImageCache, "create"):
+            cache = oiio.ImageCache.create(True)
+        else:
+            cache = oiio.ImageCache()
+        cache.attribute("max_memory_MB", float(max_memory_mb))
+    except Exception:
+        pass
+
+
+def _input_args(oiiotool: str, frame: str, channels: str | None) -> List[str]:
+    """oiiotool arguments that read ``frame``, limited to ``channels`` if given.
+
+    oiiotool 2.5+ applies the subset while reading (``-i:ch=``), so unused
+    channels of a many-layer EXR are never decoded; older versions drop
+    them with ``--ch`` after the read.
+    """
+    if not channels:
+        return [frame]
+    if oiiotool_version(oiiotool) >= (2, 5):
+        return [f"-i:ch={channels}", frame]
+    return [frame, "--ch", channels]
+
+
+def _preview_channels(channels: List[str]) -> str | None:
+    """Channels worth decoding for a colour thumbnail, or ``None`` for all."""
+    if {"R", "G", "B"}.issubset(channels):
+        return "R,G,B"
+    if len(channels) > 4:
+        return ",".join(channels[:3])
+    return None
+
+
+def render_thumbnail(oiiotool: str | None, frame: str, channels: str | None = None) -> bytes:
+    """Render a 200x200 PNG preview of ``frame`` and return its bytes.
+
+    ``channels`` (e.g. ``"R"``) restricts which channels are read. The PNG
+    is handed to ``tk.PhotoImage(data=...)``, so the scratch file only lives
+    for the duration of this call. Without ``oiiotool`` the OpenImageIO
+    bindings are used.
+    """
+    if not oiiotool:
+        if oiio is None:
+            raise RuntimeError("Neither oiiotool nor the OpenImageIO bindings are available.")
+        return render_thumbnail_oiio(frame, channels)
+    fd, tmp_path = tempfile.mkstemp(suffix=".png")
+    os.close(fd)
+    try:
+        cmd = [oiiotool, *_input_args(oiiotool, frame, channels), *THUMBNAIL_ARGS, "-o", tmp_path]
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        with open(tmp_path, "rb") as fh:
+            return fh.read()
+    finally:
+        os.unlink(tmp_path)
+
+
+def render_thumbnail_oiio(frame: str, channels: str | None = None) -> bytes:
+    """``render_thumbnail`` in-process with the OpenImageIO Python bindings.
+
+    Like ``THUMBNAIL_ARGS`` it picks pixels rather than filtering. Raises
+    ``RuntimeError`` with OIIO's message on failure.
+    """
+    buf = oiio.ImageBuf(frame)
+    if channels:
+        buf = oiio.ImageBufAlgo.channels(buf, tuple(channels.split(",")))
+    else:
+        # PNG holds at most RGBA; AOVs beyond that would fail the write.
+        buf = oiio.ImageBufAlgo.channels(buf, tuple(range(min(4, buf.nchannels))))
+    small = oiio.ImageBufAlgo.resample(buf, False, oiio.ROI(0, THUMBNAIL_SIZE, 0, THUMBNAIL_SIZE, 0, 1, 0, buf.nchannels))
+    fd, tmp_path = tempfile.mkstemp(suffix=".png")
+    os.close(fd)
+    try:
+        if not small.write(tmp_path, "uint8"):
+            raise RuntimeError(small.geterror() or buf.geterror() or f"Could not preview {frame}")
+        with open(tmp_path, "rb") as fh:
+            return fh.read()
+    finally:
+        os.unlink(tmp_path)
+
+
+def _thumbnail_cache_path(frame: str, mtime_ns: int, size: int) -> str:
+    """Where the thumbnail for this version of ``frame`` is kept on disk."""
+    key = hashlib.blake2b(f"{frame}:{mtime_ns}:{size}".encode(), digest_size=16).hexdigest()
+    return os.path.join(THUMBNAIL_CACHE_DIR, f"{key}.png")
+
+
+def _read_cached_thumbnail(path: str) -> bytes | None:
+    try:
+        with open(path, "rb") as fh:
+            png = fh.read()
+        os.utime(path)  # most recently used, for prune_thumbnail_cache
+    except OSError:
+        return None
+    return png or None
+
+
+def _store_cached_thumbnail(path: str, png: bytes) -> None:
+    try:
+        os.makedirs(THUMBNAIL_CACHE_DIR, exist_ok=True)
+        with open(path + PART_TAG, "wb") as fh:
+            fh.write(png)
+        os.replace(path + PART_TAG, path)
+    except OSError:
+        pass  # the cache is only an optimisation
+
+
+def prune_thumbnail_cache(max_bytes: int = THUMBNAIL_CACHE_MAX_BYTES) -> None:
+    """Delete the least recently used cached thumbnails beyond ``max_bytes``."""
+    try:
+        with os.scandir(THUMBNAIL_CACHE_DIR) as it:
+            entries = []
+            for entry in it:
+                if entry.is_file():
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.unlink(path)
+            total -= size
+        except OSError:
+            pass
+
+
+@lru_cache(maxsize=64)
+def _thumbnail_oiio(frame: str, mtime_ns: int, size: int, channels: str | None) -> bytes | None:
+    """Cached ``render_thumbnail_oiio``; ``None`` if the frame can't be read.
+
+    ``mtime_ns`` and ``size`` are only part of the cache key. Renders are
+    also kept on disk for later launches.
+    """
+    cache_path = _thumbnail_cache_path(frame, mtime_ns, size)
+    png = _read_cached_thumbnail(cache_path)
+    if png:
+        return png
+    try:
+        png = render_thumbnail_oiio(frame, channels)
+    except Exception:
+        return None
+    _store_cached_thumbnail(cache_path, png)
+    return png
+
+
+# OpenEXR header constants (see the OpenEXR file layout documentation).
+EXR_MAGIC = 20000630
+EXR_COMPRESSION = ("none", "rle", "zips", "zip", "piz", "pxr24", "b44", "b44a", "dwaa", "dwab")
+EXR_TILED_FLAG = 0x200  # version field bit set on single-part tiled files
+
+
+def _exr_attributes(data: bytes) -> Iterator[tuple[str, bytes]]:
+    """Yield ``(name, value)`` for each attribute of the first part header.
+
+    Raises on truncated input, so callers can read more and try again.
+    """
+    magic, version = struct.unpack_from("<ii", data, 0)
+    if magic != EXR_MAGIC:
+        raise ValueError("not an OpenEXR file")
+    pos = 8
+
+    def cstring(at: int) -> tuple[str, int]:
+        end = data.index(b"\0", at)
+        return data[at:end].decode("utf-8", "replace"), end + 1
+
+    while True:
+        name, pos = cstring(pos)
+        if not name:
+            return
+        _, pos = cstring(pos)  # attribute type
+        (size,) = struct.unpack_from("<i", data, pos)
+        value = data[pos + 4:pos + 4 + size]
+        if len(value) != size:
+            raise IndexError("truncated header")
+        pos += 4 + size
+        yield name, value
+
+
+def _parse_exr_header(data: bytes) -> tuple[List[str], dict]:
+    """Parse the first part header in ``data``; raises on truncated input."""
+    channels: List[str] = []
+    details = {}
+    compression = None
+    dwa_level = None
+    for name, value in _exr_attributes(data):
+        if name == "channels":
+            at = 0
+            while value[at:at + 1] != b"\0":
+                end = value.index(b"\0", at)
+                channels.append(value[at:end].decode("utf-8", "replace"))
+                at = end + 1 + 16  # pixel type, pLinear + reserved, x/y sampling
+        elif name == "compression":
+            compression = value[0]
+        elif name == "dataWindow":
+            xmin, ymin, xmax, ymax = struct.unpack("<iiii", value)
+            details["resolution"] = f"{xmax - xmin + 1}x{ymax - ymin + 1}"
+        elif name == "dwaCompressionLevel":
+            (dwa_level,) = struct.unpack("<f", value)
+
+    if compression is not None:
+        text = EXR_COMPRESSION[compression] if compression < len(EXR_COMPRESSION) else str(compression)
+        if dwa_level is not None and text.startswith("dwa"):
+            text = f"{text}:{dwa_level:g}"
+        details["compression"] = text
+    return channels, details
+
+
+def resolve_compression(compression: str, src: str) -> str:
+    """Turn the "auto" compression choice into a codec for ``src``.
+
+    Scanline inputs get ``zips`` (one scanline per block, so readers can
+    decode rows in parallel); tiled inputs get ``zip``. Any other choice
+    is returned unchanged.
+    """
+    if compression != "auto":
+        return compression
+    try:
+        with open(src, "rb") as fh:
+            magic, version = struct.unpack("<ii", fh.read(8))
+    except (OSError, struct.error):
+        return "zip"
+    if magic != EXR_MAGIC:
+        return "zip"
+    return "zip" if version & EXR_TILED_FLAG else "zips"
+
+
+def _read_exr_header(path: str, parse):
+    """Apply ``parse`` to the header bytes of ``path``.
+
+    Returns ``(result, file_size)``, or ``None`` if the file can't be parsed.
+    """
+    size = 64 * 1024
+    try:
+        with open(path, "rb") as fh:
+            data = fh.read(size)
+            while True:
+                try:
+                    result = parse(data)
+                    break
+                except (IndexError, ValueError, struct.error):
+                    # Rare, but a header with many channels (or a large
+                    # preview) can outgrow the first read; anything else
+                    # isn't a usable EXR.
+                    more = fh.read(len(data)) if len(data) >= size else b""
+                    if not more or data[:4] != struct.pack("<i", EXR_MAGIC):
+                        return None
+                    data += more
+            return result, os.fstat(fh.fileno()).st_size
+    except OSError:
+        return None
+
+
+def read_exr_header(path: str) -> tuple[List[str], dict] | None:
+    """Read the channel list and shot details straight from an EXR header.
+
+    Returns the same ``(channels, details)`` shape as ``_parse_info`` without
+    starting oiiotool, or ``None`` if the file can't be parsed.
+    """
+    header = _read_exr_header(path, _parse_exr_header)
+    if header is None:
+        return None
+    (channels, details), file_size = header
+    details["filesize"] = f"{file_size / (1024 * 1024):.1f} MB"
+    return channels, details
+
+
+def _parse_exr_preview(data: bytes) -> bytes | None:
+    """The header's ``preview`` attribute as binary PPM, or ``None``."""
+    for name, value in _exr_attributes(data):
+        if name == "preview":
+            width, height = struct.unpack_from("<II", value)
+            rgba = value[8:8 + width * height * 4]
+            if not width or not height or len(rgba) != width * height * 4:
+                return None
+            rgb = bytearray(width * height * 3)
+            for i in range(3):
+                rgb[i::3] = rgba[i::4]
+            return b"P6 %d %d 255\n" % (width, height) + bytes(rgb)
+    return None
+
+
+def read_exr_preview(path: str) -> bytes | None:
+    """The low-resolution preview some writers embed in the EXR header.
+
+    Returned as PPM bytes for ``tk.PhotoImage(data=...)``; ``None`` when the
+    file has no preview. Costs a header read, so it can be shown while the
+    real thumbnail renders.
+    """
+    header = _read_exr_header(path, _parse_exr_preview)
+    return header[0] if header else None
+
+
+# One pass over ``oiiotool --info -v`` output for the fields shown in the UI.
+INFO_FIELD_RE = re.compile(r"(channel list|compression|resolution|file size):(.*)$", re.MULTILINE)
+INFO_DETAIL_KEYS = {"compression": "compression", "resolution": "resolution", "file size": "filesize"}
+
+
+def _parse_info(output: str) -> tuple[List[str], dict]:
+    """Extract the channel list and shot details from ``oiiotool --info -v`` output.
+
+    Multi-part files list every part; like ``read_exr_header``, only the
+    first occurrence of each field (the first part) is used.
+    """
+    channels: List[str] = []
+    details = {}
+    seen = set()
+    for field, value in INFO_FIELD_RE.findall(output):
+        if field in seen:
+            continue
+        seen.add(field)
+        if field == "channel list":
+            channels = [c.strip() for c in value.split(",")]
+        else:
+            details[INFO_DETAIL_KEYS[field]] = value.strip().strip('"')
+    return channels, details
+
+
+@lru_cache(maxsize=64)
+def _probe_frame(oiiotool: str, frame: str, mtime_ns: int, size: int) -> tuple[bytes | None, tuple[str, ...], dict]:
+    """Read a frame's info and render its thumbnail with a single oiiotool call.
+
+    Returns ``(png_bytes, channels, details)``; ``png_bytes`` is ``None`` if
+    the thumbnail could not be written. The info comes from the EXR header
+    when it can be parsed, otherwise from ``--info -v``. ``mtime_ns`` and
+    ``size`` are only part of the cache key, so a rewritten frame is probed
+    again even on filesystems with coarse timestamps. Thumbnails are also
+    kept on disk, so a frame previewed in an earlier session needs no
+    oiiotool run at all when its header can be parsed.
+    """
+    header = read_exr_header(frame)
+    cache_path = _thumbnail_cache_path(frame, mtime_ns, size)
+    if header:
+        png = _read_cached_thumbnail(cache_path)
+        if png:
+            return png, tuple(header[0]), header[1]
+        # Only decode the channels the thumbnail shows.
+        read_args = _input_args(oiiotool, frame, _preview_channels(header[0]))
+        info_args = []
+    else:
+        read_args = [frame]
+        info_args = ["--info", "-v"]
+    fd, tmp_path = tempfile.mkstemp(suffix=".png")
+    os.close(fd)
+    try:
+        result = subprocess.run(
+            [oiiotool, *read_args, *info_args, *THUMBNAIL_ARGS, "-o", tmp_path],
+            stdout=subprocess.PIPE if info_args else subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        channels, details = header or _parse_info(result.stdout)
+        png = None
+        if result.returncode == 0:
+            with open(tmp_path, "rb") as fh:
+                png = fh.read() or None
+        if png:
+            _store_cached_thumbnail(cache_path, png)
+        return png, tuple(channels), details
+    except OSError:
+        channels, details = header or ([], {})
+        return None, tuple(channels), details
+    finally:
+        os.unlink(tmp_path)
+
+
 def download_oiiotool() -> str | None:
     """Download and extract oiiotool for Windows.
     
@@ -101,124 +677,357 @@ class Shot:
     sbs_frames: int
     needs_conversion: bool
     conversion_progress: float  # 0.0 to 1.0
-    dropbox_status: str # "Not Started", "In Progress", "Complete"
-    dropbox_progress: float # 0.0 to 1.0
     is_moved: bool = False
     moved_path: str = ""
 
+    # Dropbox sync isn't tracked yet; assume the client has synced whatever
+    # has been converted into the local SBS folder. Derived on access so a
+    # scan doesn't compute values nobody looks at.
+    @property
+    def dropbox_progress(self) -> float:
+        """Synced fraction of the shot, 0.0 to 1.0."""
+        return min(self.conversion_progress, 1.0)
+
+    @property
+    def dropbox_status(self) -> str:
+        """One of "Not Started", "In Progress" or "Complete"."""
+        progress = self.dropbox_progress
+        if progress >= 1.0:
+            return "Complete"
+        return "In Progress" if progress > 0 else "Not Started"
+
+
+# Shot list label text and colour per status; "converting" has its text
+# filled in with the frame counts.
+SHOT_STATUS_STYLES = {
+    "moved": ("✅ Moved to Comp", "blue"),
+    "empty": ("No EXR files", "gray"),
+    "complete": ("✅ Complete", "green"),
+    "converting": (None, "orange"),
+    "not_started": ("⏳ Not started", "red"),
+}
+
+
+def shot_status_key(shot: Shot) -> str:
+    """The ``SHOT_STATUS_STYLES`` key describing ``shot``."""
+    if shot.is_moved:
+        return "moved"
+    if shot.frames == 0:
+        return "empty"
+    if shot.conversion_progress == 1.0:
+        return "complete"
+    return "converting" if shot.conversion_progress > 0 else "not_started"
+
+
+def _classify(name: str) -> int:
+    """Classify a file name as ``NOT_EXR``, ``SOURCE_FRAME`` or ``SBS_FRAME``."""
+    if not name.endswith(EXR_SUFFIXES) or name[:-4].endswith(PART_TAG):
+        return NOT_EXR
+    return SBS_FRAME if "_SBS" in name else SOURCE_FRAME
+
+
+def _iter_exr_entries(path: str) -> Iterator[tuple[int, os.DirEntry]]:
+    """Recursively yield ``(kind, DirEntry)`` for EXR files below ``path``.
+
+    ``kind`` is ``SOURCE_FRAME`` or ``SBS_FRAME`` (see ``_classify``). Uses
+    ``os.scandir`` so the file/directory checks come from the directory read
+    itself instead of one ``stat`` per name. Missing or unreadable
+    directories are skipped, matching ``os.walk``.
+    """
+    stack = [path]
+    push = stack.append
+    classify = _classify  # local lookups in the per-entry loop
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        push(entry.path)
+                        continue
+                    # is_file() only stats symlinks, which are followed so
+                    # symlinked (held or duplicated) frames still count.
+                    kind = classify(entry.name)
+                    if kind and entry.is_file():
+                        yield kind, entry
+        except OSError:
+            continue
+
+
+def _iter_temp_entries(path: str) -> Iterator[os.DirEntry]:
+    """Recursively yield leftover temp files below ``path``.
+
+    These are ``.part`` outputs of interrupted conversions and ``tmp*.exr``
+    files left by older versions.
+    """
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif is_part_file(entry.name) or (entry.name.startswith("tmp") and entry.name.endswith(".exr")):
+                        yield entry
+        except OSError:
+            continue
+
+
+# (kind, path) -> (st_mtime_ns, monotonic time counted, count)
+_dir_count_cache: Dict[tuple[int, str], tuple[int, float, int]] = {}
+
+
+def _cached_count(path: str, kind: int) -> int:
+    """Count EXR files of ``kind`` (0 = any) below ``path``, reusing a recent count.
+
+    A cached count is reused while the directory's mtime is unchanged and it
+    is younger than ``DIR_CACHE_TTL``. The TTL covers file systems with
+    unreliable mtimes and changes inside sub-directories, which don't touch
+    the top-level mtime.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+    key = (kind, path)
+    now = time.monotonic()
+    cached = _dir_count_cache.get(key)
+    if cached and cached[0] == mtime_ns and now - cached[1] < DIR_CACHE_TTL:
+        return cached[2]
+    count = sum(1 for k, _ in _iter_exr_entries(path) if not kind or k == kind)
+    _dir_count_cache[key] = (mtime_ns, now, count)
+    return count
+
+
+def clear_dir_cache() -> None:
+    """Forget all cached frame counts."""
+    _dir_count_cache.clear()
+
 
 def frame_count(path: str) -> int:
     """Recursively count source EXR files in a directory."""
-    if not os.path.exists(path):
-        return 0
-    return sum(1 for _, _, files in os.walk(path)
-               for f in files if f.lower().endswith(".exr") and "_SBS" not in f)
+    return _cached_count(path, SOURCE_FRAME)
 
 
 def sbs_frame_count(path: str) -> int:
     """Recursively count SBS EXR files in a directory."""
-    if not os.path.exists(path):
-        return 0
-    return sum(1 for _, _, files in os.walk(path)
-               for f in files if f.lower().endswith(".exr"))
+    return _cached_count(path, 0)
+
+
+def _chunks(items: List[str], size: int) -> Iterator[List[str]]:
+    """Yield consecutive slices of ``items`` with at most ``size`` entries."""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+FRAME_NUMBER_RE = re.compile(r"^(.*?)(\d+)(\.exr)$", re.IGNORECASE)
+
+
+def frame_sequence(frames: List[str]) -> tuple[str, int, int] | None:
+    """Describe ``frames`` as one contiguous numbered sequence, if they are.
+
+    Returns ``(pattern, first, last)`` with a printf-style pattern such as
+    ``a.%04d.exr``, or ``None`` when the names don't share a stem and padding
+    or the numbers have gaps.
+    """
+    stem = pad = ext = None
+    first = last = None
+    for frame in frames:
+        match = FRAME_NUMBER_RE.match(frame)
+        if not match or any(c in match.group(1) for c in "%#@"):
+            return None
+        number = match.group(2)
+        if stem is None:
+            stem, pad, ext = match.group(1), len(number), match.group(3)
+            first = last = int(number)
+        elif (match.group(1), len(number), match.group(3)) != (stem, pad, ext) or int(number) != last + 1:
+            return None
+        else:
+            last = int(number)
+    if stem is None:
+        return None
+    return f"{stem}%0{pad}d{ext}", first, last
+
+
+@lru_cache(maxsize=None)
+def oiiotool_version(oiiotool: str) -> tuple[int, ...]:
+    """Return oiiotool's version, e.g. ``(2, 5, 9, 0)``, or ``()`` if unknown."""
+    try:
+        output = subprocess.run(
+            [oiiotool, "--version"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+        ).stdout
+    except OSError:
+        return ()
+    match = re.search(r"\d+(?:\.\d+)+", output)
+    return tuple(int(p) for p in match.group(0).split(".")) if match else ()
+
+
+def sbs_frame_name(frame: str) -> str:
+    """Return the output name for a source frame, e.g. ``a.0001_SBS.exr``."""
+    return f"{frame[:-4]}_SBS{frame[-4:]}"
+
+
+def part_name(dst: str) -> str:
+    """Return the in-progress name for an output, e.g. ``a.0001_SBS.part.exr``.
+
+    The ``.exr`` extension is kept so oiiotool still picks the EXR writer.
+    """
+    return f"{dst[:-4]}{PART_TAG}{dst[-4:]}"
+
+
+def is_part_file(name: str) -> bool:
+    """True for partially written outputs (see ``part_name``)."""
+    return name.endswith(EXR_SUFFIXES) and name[:-4].endswith(PART_TAG)
 
 
 def load_shot_statuses(root: str) -> Dict[str, dict]:
     """Load shot statuses from .shot_status.json."""
     status_file = os.path.join(root, ".shot_status.json")
     if os.path.exists(status_file):
-        with open(status_file, "r") as f:
-            try:
-                return json.load(f)
-            except json.JSONDecodeError:
-                return {}
+        with open(status_file, "rb") as f:
+            data = f.read()
+        try:
+            return orjson.loads(data) if orjson is not None else json.loads(data)
+        except ValueError:  # JSONDecodeError and orjson's error both subclass it
+            return {}
     return {}
 
 def save_shot_statuses(root: str, statuses: Dict[str, dict]) -> None:
-    """Save shot statuses to .shot_status.json."""
+    """Save shot statuses to .shot_status.json.
+
+    The file is written compactly to a temporary name and then swapped in,
+    so a crash mid-write can't leave a truncated status file behind.
+    """
     status_file = os.path.join(root, ".shot_status.json")
-    with open(status_file, "w") as f:
-        json.dump(statuses, f, indent=4)
+    temp_file = status_file + PART_TAG
+    if orjson is not None:
+        data = orjson.dumps(statuses)
+    else:
+        data = json.dumps(statuses, separators=(",", ":")).encode()
+    with open(temp_file, "wb") as f:
+        f.write(data)
+    os.replace(temp_file, status_file)
+
+def _classify_shot(
+    entry: os.DirEntry, ready_for_comp_path: str, comp_dirs: Set[str], sbs_dirs: Set[str], prev: dict
+) -> Shot:
+    """Count a shot's frames and build its ``Shot`` record.
+
+    ``comp_dirs`` and ``sbs_dirs`` are the (``normcase``d) directory names in
+    the comp folder and next to the shot, so no per-shot ``exists`` call is
+    needed. ``prev`` is the shot's saved status; a shot that was already
+    moved and is still in the comp folder keeps its saved counts.
+    """
+    shot_name = entry.name
+    shot_path = entry.path
+
+    # Filesystem is the source of truth for 'is_moved'
+    source_sbs_path = f"{shot_path}_SBS"
+    comp_sbs_path = os.path.join(ready_for_comp_path, f"{shot_name}_SBS")
+
+    sbs_frames = 0
+    is_moved = False
+    sbs_name = os.path.normcase(f"{shot_name}_SBS")
+    if sbs_name in comp_dirs and prev.get("is_moved") and "frames" in prev and "sbs_frames" in prev:
+        # A moved shot can't regress, so don't count it again.
+        frames = prev["frames"]
+        sbs_frames = prev["sbs_frames"]
+        is_moved = True
+    elif sbs_name in comp_dirs:
+        frames = frame_count(shot_path)
+        sbs_frames = sbs_frame_count(comp_sbs_path)
+        is_moved = True
+    elif sbs_name in sbs_dirs:
+        frames = frame_count(shot_path)
+        sbs_frames = sbs_frame_count(source_sbs_path)
+        is_moved = False
+    else:
+        frames = frame_count(shot_path)
+
+    needs_conversion = frames > sbs_frames
+    conversion_progress = sbs_frames / frames if frames > 0 else 0.0
+
+    return Shot(
+        name=shot_name,
+        path=shot_path,
+        has_sbs=not needs_conversion,
+        frames=frames,
+        sbs_frames=sbs_frames,
+        needs_conversion=needs_conversion,
+        conversion_progress=conversion_progress,
+        is_moved=is_moved,
+        moved_path=ready_for_comp_path if is_moved else ""
+    )
+
+
+def _dir_names(path: str) -> Set[str]:
+    """``normcase``d names of the directories directly inside ``path``.
 
-def scan_shots(root: str, ready_for_comp_path: str) -> List[Shot]:
-    """Scan for shots in both source and comp folders, using the filesystem as the source of truth."""
+    Returns an empty set if ``path`` can't be listed.
+    """
+    try:
+        with os.scandir(path) as it:
+            return {os.path.normcase(entry.name) for entry in it if entry.is_dir()}
+    except OSError:
+        return set()
+
+
+def scan_shots(root: str, ready_for_comp_path: str, workers: int = SCAN_WORKERS) -> List[Shot]:
+    """Scan for shots in both source and comp folders, using the filesystem as the source of truth.
+
+    Up to ``workers`` shot folders are counted concurrently.
+    """
     shots_map: Dict[str, Shot] = {}
     statuses = load_shot_statuses(root)
+    # Live mode rescans every few seconds; only rewrite the file on change.
+    loaded = json.dumps(statuses, sort_keys=True)
 
     # 1. Scan the source directory for monoscopic shots
+    # Filter before sorting so only candidate shot folders are kept around;
+    # the _SBS folders seen on the way are remembered by name.
+    shot_entries = []
+    sbs_dirs: Set[str] = set()
     try:
-        entries = sorted(os.scandir(root), key=lambda e: e.name)
+        with os.scandir(root) as it:
+            for entry in it:
+                if not entry.is_dir() or entry.name.startswith('.') or entry.name == '__pycache__':
+                    continue
+                if entry.name.endswith("_SBS"):
+                    sbs_dirs.add(os.path.normcase(entry.name))
+                else:
+                    shot_entries.append(entry)
     except FileNotFoundError:
-        entries = []
-
-    for entry in entries:
-        if not entry.is_dir() or entry.name.startswith('.') or entry.name == '__pycache__' or entry.name.endswith("_SBS"):
-            continue
-
-        shot_name = entry.name
-        shot_path = entry.path
-        frames = frame_count(shot_path)
-        
-        # Filesystem is the source of truth for 'is_moved'
-        source_sbs_path = f"{shot_path}_SBS"
-        comp_sbs_path = os.path.join(ready_for_comp_path, f"{shot_name}_SBS")
-        
-        sbs_frames = 0
-        is_moved = False
-        if os.path.exists(comp_sbs_path):
-            sbs_frames = sbs_frame_count(comp_sbs_path)
-            is_moved = True
-        elif os.path.exists(source_sbs_path):
-            sbs_frames = sbs_frame_count(source_sbs_path)
-            is_moved = False
-
-        shot_status = statuses.get(shot_name, {})
-        shot_status['is_moved'] = is_moved  # Update status based on filesystem reality
-
-        needs_conversion = frames > sbs_frames
-        conversion_progress = sbs_frames / frames if frames > 0 else 0.0
-        
-        # --- Dropbox Status ---
-        # This is based on the local SBS folder, assuming Dropbox client is syncing it.
-        dropbox_progress = conversion_progress
-        if dropbox_progress >= 1.0:
-            dropbox_status = "Complete"
-            dropbox_progress = 1.0
-        elif dropbox_progress > 0:
-            dropbox_status = "In Progress"
-        else:
-            dropbox_status = "Not Started"
-        
-        shot_status['dropbox_status'] = dropbox_status
-        shot_status['dropbox_progress'] = dropbox_progress
-
-        shots_map[shot_name] = Shot(
-            name=shot_name,
-            path=shot_path,
-            has_sbs=not needs_conversion,
-            frames=frames,
-            sbs_frames=sbs_frames,
-            needs_conversion=needs_conversion,
-            conversion_progress=conversion_progress,
-            dropbox_status=dropbox_status,
-            dropbox_progress=dropbox_progress,
-            is_moved=is_moved,
-            moved_path=ready_for_comp_path if is_moved else ""
-        )
-
+        pass
+    shot_entries.sort(key=lambda e: e.name)
+
+    # One listing of the comp folder instead of an exists() per shot.
+    comp_dirs = _dir_names(ready_for_comp_path)
+
+    # Counting frames is I/O-bound (and slow on network shares), so probe
+    # the shots in parallel; map() keeps the sorted order.
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(shot_entries)))) as executor:
+        shots = list(executor.map(
+            lambda e: _classify_shot(e, ready_for_comp_path, comp_dirs, sbs_dirs, statuses.get(e.name, {})),
+            shot_entries,
+        ))
+
+    for shot in shots:
+        shot_status = statuses.get(shot.name, {})
+        shot_status['is_moved'] = shot.is_moved  # Update status based on filesystem reality
+        shot_status['dropbox_status'] = shot.dropbox_status
+        shot_status['dropbox_progress'] = shot.dropbox_progress
         shot_status.update({
-            "path": shot_path,
-            "frames": frames,
-            "sbs_frames": sbs_frames,
+            "path": shot.path,
+            "frames": shot.frames,
+            "sbs_frames": shot.sbs_frames,
         })
-        statuses[shot_name] = shot_status
+        statuses[shot.name] = shot_status
+        shots_map[shot.name] = shot
 
     # 2. Add shots that are only in the status file (e.g., folder deleted from source)
     for name, status in statuses.items():
         if name not in shots_map and status.get("is_moved"):
             # Verify it's still in the comp folder, otherwise it's just gone
-            comp_sbs_path = os.path.join(ready_for_comp_path, f"{name}_SBS")
-            if os.path.exists(comp_sbs_path):
+            if os.path.normcase(f"{name}_SBS") in comp_dirs:
                 shots_map[name] = Shot(
                     name=name,
                     path=status.get("path", ""), # Path might be stale, but it's all we have
@@ -227,32 +1036,238 @@ def scan_shots(root: str, ready_for_comp_path: str) -> List[Shot]:
                     sbs_frames=status.get("sbs_frames", 0),
                     needs_conversion=False,
                     conversion_progress=1.0,
-                    dropbox_status="Complete",
-                    dropbox_progress=1.0,
                     is_moved=True,
                     moved_path=status.get("moved_path", ready_for_comp_path)
                 )
 
-    save_shot_statuses(root, statuses)
+    if json.dumps(statuses, sort_keys=True) != loaded:
+        save_shot_statuses(root, statuses)
     return sorted(shots_map.values(), key=lambda s: s.name)
 
 
+_scan_pool: ProcessPoolExecutor | None = None
+_scan_pool_lock = threading.Lock()
+
+
+def _scan_in_worker(root: str, ready_for_comp_path: str, fresh: bool) -> List[Shot]:
+    if fresh:
+        clear_dir_cache()
+    return scan_shots(root, ready_for_comp_path)
+
+
+def scan_shots_in_process(root: str, ready_for_comp_path: str, fresh: bool = False) -> List[Shot]:
+    """Run ``scan_shots`` in a helper process so it doesn't hold the GUI's GIL.
+
+    The single worker process is kept for the life of the app, so its frame
+    count cache survives between scans; ``fresh`` clears it first. Falls
+    back to scanning in this process if the pool can't be used. Errors
+    raised by the scan itself are passed on to the caller.
+    """
+    global _scan_pool
+    pool = None
+    try:
+        with _scan_pool_lock:
+            if _scan_pool is None:
+                # spawn, not fork: forking a process that runs Tk and
+                # worker threads isn't safe.
+                _scan_pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+            pool = _scan_pool
+        future = pool.submit(_scan_in_worker, root, ready_for_comp_path, fresh)
+    except (OSError, BrokenProcessPool, RuntimeError):
+        _drop_scan_pool(pool)
+        return _scan_in_worker(root, ready_for_comp_path, fresh)
+    try:
+        return future.result()
+    except BrokenProcessPool:
+        _drop_scan_pool(pool)
+        return _scan_in_worker(root, ready_for_comp_path, fresh)
+
+
+def _drop_scan_pool(pool: ProcessPoolExecutor | None) -> None:
+    """Forget and shut down a scan pool that can't be used any more."""
+    global _scan_pool
+    with _scan_pool_lock:
+        if _scan_pool is pool:
+            _scan_pool = None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+class _ChangeFlag:
+    """watchdog event handler that sets ``event`` when files change.
+
+    Only content changes count: open/close events (e.g. from previews
+    reading frames), the "modified" events a directory gets alongside
+    each change inside it, and writes to the status file are ignored.
+    So is everything inside ``*_SBS`` folders and temp files, which is
+    mostly this app's own conversion output.
+    """
+
+    EVENT_TYPES = {"created", "modified", "deleted", "moved"}
+
+    def __init__(self, event: threading.Event, root: str) -> None:
+        self.event = event
+        self.root = root
+
+    def _ignored(self, path) -> bool:
+        path = os.fsdecode(path)
+        name = os.path.basename(path)
+        if name.startswith(".shot_status") or is_part_file(name):
+            return True
+        if name.startswith("tmp") and name.endswith(".exr"):
+            return True
+        try:
+            parts = os.path.relpath(path, self.root).split(os.sep)
+        except ValueError:
+            return False
+        return any(part.endswith("_SBS") for part in parts[:-1])
+
+    def dispatch(self, event) -> None:
+        if event.event_type not in self.EVENT_TYPES:
+            return
+        if event.is_directory and event.event_type == "modified":
+            return
+        paths = [event.src_path]
+        if event.event_type == "moved":
+            paths.append(event.dest_path)
+        if all(self._ignored(path) for path in paths):
+            return
+        self.event.set()
+
+
+class _NotifyingQueue(queue.Queue):
+    """``queue.Queue`` that writes a byte to a pipe for every ``put``.
+
+    The read end is watched by Tk (``createfilehandler``), so the GUI wakes
+    up when a message arrives instead of polling an empty queue.
+    """
+
+    def __init__(self, notify_fd: int) -> None:
+        super().__init__()
+        self._notify_fd = notify_fd
+
+    def put(self, item, block: bool = True, timeout: float | None = None) -> None:
+        super().put(item, block, timeout)
+        try:
+            os.write(self._notify_fd, b"\0")
+        except BlockingIOError:
+            pass  # Pipe full: a wakeup is already pending.
+
+
+class _SignallingQueue(queue.Queue):
+    """``queue.Queue`` that sets ``ready`` on every ``put``.
+
+    Used where Tk can't watch a pipe (Windows): a helper thread waits on
+    ``ready`` and wakes the GUI with a virtual event.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.ready = threading.Event()
+
+    def put(self, item, block: bool = True, timeout: float | None = None) -> None:
+        super().put(item, block, timeout)
+        self.ready.set()
+
+
+class CpuMeter:
+    """Non-blocking CPU usage sampler.
+
+    Uses ``psutil.cpu_percent(interval=None)`` for system-wide usage when
+    available. Otherwise falls back to ``os.times()`` for this process plus
+    its finished children (the oiiotool jobs), relative to all cores.
+    """
+
+    def __init__(self) -> None:
+        self._prev = self._read()
+        if psutil:
+            psutil.cpu_percent(interval=None)
+
+    @staticmethod
+    def _read() -> tuple[float, float]:
+        t = os.times()
+        return t.user + t.system + t.children_user + t.children_system, time.monotonic()
+
+    def sample(self) -> float:
+        """Percent CPU used since the previous sample."""
+        if psutil:
+            return psutil.cpu_percent(interval=None)
+        busy, wall = self._read()
+        prev_busy, prev_wall = self._prev
+        self._prev = busy, wall
+        elapsed = (wall - prev_wall) * (os.cpu_count() or 1)
+        return min(100.0, 100.0 * (busy - prev_busy) / elapsed) if elapsed > 0 else 0.0
+
+
+class _ThrottledEmitter:
+    """Put progress messages on a queue at most once per interval per kind.
+
+    Meant for values where only the newest one matters (``shot``,
+    ``overall``, ``eta``, ``cpu``); log lines go straight to the queue.
+    """
+
+    def __init__(self, q: queue.Queue, intervals: Dict[str, float] | None = None) -> None:
+        self._queue = q
+        self._intervals = intervals or {}
+        self._last: Dict[str, float] = {}
+
+    def ready(self, kind: str) -> bool:
+        """True if a ``kind`` message would be sent now."""
+        last = self._last.get(kind)
+        return last is None or time.monotonic() - last >= self._intervals.get(kind, PROGRESS_INTERVAL)
+
+    def emit(self, kind: str, *payload, force: bool = False) -> bool:
+        """Send ``(kind, *payload)`` unless throttled; ``force`` always sends."""
+        if not (force or self.ready(kind)):
+            return False
+        self._last[kind] = time.monotonic()
+        self._queue.put((kind, *payload))
+        return True
+
+
 class ConverterGUI(tk.Tk):
+    # Queue polling: at most MAX_UPDATE_HZ UI updates a second while busy,
+    # one poll every IDLE_POLL_MS milliseconds while nothing is happening.
+    MAX_UPDATE_HZ = 30
+    IDLE_POLL_MS = 200
+    # Messages handled per run; the rest wait for the next run so a flood
+    # can't stall the event loop.
+    MAX_MESSAGES_PER_RUN = 500
+
     def __init__(self) -> None:
         super().__init__()
         self.title("SBS EXR Converter")
         self.geometry("900x600")
         self.shots: List[Shot] = []
         self.shot_vars: List[tk.BooleanVar] = []
-        self.queue: queue.Queue = queue.Queue()
+        self._shot_rows: Dict[str, tuple] = {}
+        self._shot_row_shots: Dict[str, Shot] = {}  # what each row shows
+        self._shots_by_path: Dict[str, Shot] = {}
+        self._shots_placeholder: ttk.Label | None = None
+        self.queue: queue.Queue = self._make_queue()
         self.oiiotool = find_oiiotool()
         self.thumbnail: tk.PhotoImage | None = None
         self.current_frame: str = ""
         self.scanning = False
+        # Set from the moment a scan thread is started until it returns;
+        # unlike ``scanning`` it doesn't wait for the queue to be drained.
+        self._scan_in_flight = threading.Event()
+        self._last_scan_duration = 0.0
         self.selected_shot_frame: ttk.Frame | None = None
-        self.ready_for_comp_path = tk.StringVar(value=r"D:\Boona Dropbox\Boona Slate\01_Active\Silver_SIL_JUL25_BS-144\Production\Output\Silver - Renders\Unreal Renders\ReadyForComp")
+        self._preview_token = 0
+        self._applied_progress: Dict[str, tuple] = {}
+        self._preview_after: str | None = None
+        # (frame, st_mtime_ns, st_size) -> PhotoImage, least recently used first
+        self._thumb_cache: OrderedDict = OrderedDict()
+        self.ready_for_comp_path = tk.StringVar(value=DEFAULT_READY_FOR_COMP)
         self.live_mode_thread = None
         self.shot_last_activity: Dict[str, float] = {}
+        # Shots added while a conversion is running, picked up by its
+        # worker; ``None`` when no conversion is running. ``_converting``
+        # holds the paths of every shot in the current run.
+        self._convert_lock = threading.Lock()
+        self._convert_queue: List[Shot] | None = None
+        self._converting: Set[str] = set()
 
         # Custom styles
         style = ttk.Style(self)
@@ -264,6 +1279,9 @@ class ConverterGUI(tk.Tk):
         self._build_widgets()
         self.after(100, self.process_queue)
         self.after(60000, self._periodic_cleanup)
+        # Probe the version now so the first conversion doesn't pay for it.
+        threading.Thread(target=self._report_oiiotool, daemon=True).start()
+        threading.Thread(target=prune_thumbnail_cache, daemon=True).start()
 
     # UI -----------------------------------------------------------------
     def _build_widgets(self) -> None:
@@ -286,19 +1304,29 @@ class ConverterGUI(tk.Tk):
         ttk.Label(opts, text="Compression:").grid(row=0, column=0, sticky=tk.W)
         self.compression = tk.StringVar(value="dwab:45")
         ttk.Combobox(opts, textvariable=self.compression,
-                     values=["dwab:45", "dwaa:45", "zip", "none"],
+                     values=["dwab:45", "dwaa:45", "zips", "zip", "auto", "none"],
                      state="readonly").grid(row=0, column=1, sticky=tk.W)
 
         ttk.Label(opts, text="Pixel Type:").grid(row=1, column=0, sticky=tk.W)
-        self.datatype = tk.StringVar(value="float")
+        # Half is plenty for delivery and halves the bytes written; float
+        # is there for data passes that need full precision.
+        self.datatype = tk.StringVar(value="half")
         ttk.Combobox(opts, textvariable=self.datatype,
-                     values=["float", "half"],
+                     values=["half", "float"],
                      state="readonly").grid(row=1, column=1, sticky=tk.W)
 
         ttk.Label(opts, text="Max Parallel Jobs:").grid(row=0, column=2, sticky=tk.W, padx=(10, 0))
-        self.max_workers = tk.IntVar(value=os.cpu_count() or 4)
+        self.max_workers = tk.IntVar(value=default_worker_count())
         ttk.Spinbox(opts, from_=1, to=os.cpu_count() or 32, textvariable=self.max_workers).grid(row=0, column=3, sticky=tk.W)
 
+        ttk.Label(opts, text="Threads per Job:").grid(row=0, column=4, sticky=tk.W, padx=(10, 0))
+        self.oiio_threads = tk.IntVar(value=OIIO_THREADS_PER_JOB)
+        ttk.Spinbox(opts, from_=1, to=os.cpu_count() or 32, textvariable=self.oiio_threads, width=4).grid(row=0, column=5, sticky=tk.W)
+        self.memory_mb = total_memory_mb()
+        if oiio is not None and self.memory_mb:
+            # In-process jobs share one cache, so it gets the whole budget.
+            configure_oiio_cache(int(self.memory_mb * IMAGECACHE_RAM_FRACTION))
+
         # Live Mode Controls
         live_frame = ttk.Frame(opts)
         live_frame.grid(row=1, column=2, columnspan=2, sticky=tk.W, padx=(10, 0))
@@ -328,11 +1356,8 @@ class ConverterGUI(tk.Tk):
 
         self.shots_canvas = tk.Canvas(self.shots_frame)
         self.shots_scroll = ttk.Scrollbar(self.shots_frame, orient="vertical", command=self.shots_canvas.yview)
-        self.shots_inner = ttk.Frame(self.shots_canvas)
-        self.shots_inner.bind(
-            "<Configure>", lambda e: self.shots_canvas.configure(scrollregion=self.shots_canvas.bbox("all"))
-        )
-        self.shots_canvas.create_window((0, 0), window=self.shots_inner, anchor="nw")
+        self._shots_window = None
+        self._new_shots_inner()
         self.shots_canvas.configure(yscrollcommand=self.shots_scroll.set)
         self.shots_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.shots_scroll.pack(side=tk.RIGHT, fill=tk.Y)
@@ -360,7 +1385,7 @@ class ConverterGUI(tk.Tk):
         controls.pack(fill=tk.X, padx=10, pady=5)
         self.convert_btn = ttk.Button(controls, text="Convert Selected", command=self.start_convert)
         self.convert_btn.pack(side=tk.LEFT)
-        ttk.Button(controls, text="Convert Single Frame", command=self.convert_single).pack(side=tk.LEFT, padx=5)
+        ttk.Button(controls, text="Convert Frames...", command=self.convert_single).pack(side=tk.LEFT, padx=5)
         self.move_selected_btn = ttk.Button(controls, text="Move Selected to Comp", command=self.move_selected_to_comp)
         self.move_selected_btn.pack(side=tk.LEFT, padx=5)
 
@@ -381,8 +1406,17 @@ class ConverterGUI(tk.Tk):
 
         log_frame = ttk.LabelFrame(self, text="Log")
         log_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-        self.log = tk.Text(log_frame, height=8)
+        # Read-only, no undo history and no line wrapping: the log only
+        # ever grows at the end, so skip the bookkeeping for edits.
+        self.log = tk.Text(log_frame, height=8, undo=False, maxundo=0, autoseparators=False,
+                           wrap="none", state=tk.DISABLED)
+        # Same lines as the widget shows, kept for save_log so saving
+        # doesn't copy the whole Text contents.
+        self._log_ring: deque = deque(maxlen=LOG_MAX_LINES)
+        log_xscroll = ttk.Scrollbar(log_frame, orient=tk.HORIZONTAL, command=self.log.xview)
+        self.log.configure(xscrollcommand=log_xscroll.set)
         self.log.pack(fill=tk.BOTH, expand=True)
+        log_xscroll.pack(fill=tk.X)
         ttk.Button(log_frame, text="Save Log", command=self.save_log).pack(anchor=tk.E, pady=5)
 
     # Folder scan ---------------------------------------------------------
@@ -402,100 +1436,198 @@ class ConverterGUI(tk.Tk):
         if not hasattr(self, 'current_folder') or not self.current_folder:
             messagebox.showinfo("No folder selected", "Please select a folder first.")
             return
-        self.load_folder_from_path(self.current_folder)
+        clear_dir_cache()
+        self.load_folder_from_path(self.current_folder, fresh=True)
+
+    def load_folder_from_path(self, folder: str, fresh: bool = False) -> None:
+        """Load folder from a specific path (used by refresh).
 
-    def load_folder_from_path(self, folder: str) -> None:
-        """Load folder from a specific path (used by refresh)."""
+        ``fresh`` discards cached frame counts before scanning.
+        """
         self.current_folder = folder
+        self._scan_in_flight.set()
         self.queue.put(("scan_started",))
         comp_folder = self.ready_for_comp_path.get()
         threading.Thread(
             target=self._scan_worker,
-            args=(folder, comp_folder),
+            args=(folder, comp_folder, fresh),
             daemon=True,
         ).start()
 
-    def _scan_worker(self, folder: str, comp_folder: str) -> None:
+    def _scan_worker(self, folder: str, comp_folder: str, fresh: bool = False) -> None:
         """Scan for shots in a background thread."""
-        shots = scan_shots(folder, comp_folder)
+        start = time.monotonic()
+        try:
+            shots = scan_shots_in_process(folder, comp_folder, fresh)
+        except Exception as e:
+            # Keep showing the previous shots; scan_finished re-enables
+            # the Load and Refresh buttons.
+            self.queue.put(("log", f"❌ Scan of {folder} failed: {e}"))
+            shots = self.shots
+        finally:
+            self._last_scan_duration = time.monotonic() - start
+            self._scan_in_flight.clear()
         self.queue.put(("scan_finished", shots))
 
     def _update_shot_list(self, shots: List[Shot]) -> None:
-        """Update the UI with the list of shots."""
+        """Update the UI with the list of shots.
+
+        Rows are keyed by shot path and updated in place, so a refresh only
+        creates or destroys widgets for shots that appeared or disappeared,
+        and keeps the user's checkbox selections.
+        """
+        previous_order = list(self._shot_rows)
         self.shots = shots
-        self.selected_shot_frame = None # Reset selected frame
-        for child in self.shots_inner.winfo_children():
-            child.destroy()
-        self.shots_canvas.yview_moveto(0)
-        self.shot_vars = []
+        self._shots_by_path = {shot.path: shot for shot in shots}
+
+        reset_preview = not previous_order
+        if previous_order and not any(path in self._shots_by_path for path in previous_order):
+            # A different folder: swap in a fresh frame rather than
+            # destroying the old rows one at a time.
+            self._new_shots_inner()
+            self.selected_shot_frame = None
+            previous_order = []
+            reset_preview = True
+        for path in previous_order:
+            if path not in self._shots_by_path:
+                row = self._shot_rows.pop(path)
+                self._shot_row_shots.pop(path, None)
+                if row[0] is self.selected_shot_frame:
+                    self.selected_shot_frame = None
+                    reset_preview = True
+                row[0].destroy()
+
         if not shots:
-            ttk.Label(self.shots_inner, text="No shots found.").pack(pady=10)
+            self._set_shots_placeholder("No shots found.")
+            self.shot_vars = []
+            self.selected_shot_frame = None
             return
+        self._set_shots_placeholder(None)
+        if not previous_order:
+            self.shots_canvas.yview_moveto(0)
 
-        for shot in self.shots:
-            var = tk.BooleanVar(value=shot.needs_conversion)
-            
-            shot_frame = ttk.Frame(self.shots_inner)
-            shot_frame.pack(fill=tk.X, pady=2, padx=5)
-            # Configure the grid columns. Column 1 should expand.
-            shot_frame.columnconfigure(1, weight=1)
-            shot_frame.columnconfigure(2, minsize=120) # Give status column a fixed width
-
-            cb = ttk.Checkbutton(shot_frame, variable=var)
-            cb.grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
-
-            if shot.is_moved:
-                cb.state(["disabled"])
-
-            # Create detailed status label
-            if shot.is_moved:
-                status = "✅ Moved to Comp"
-                color = "blue"
-            elif shot.frames == 0:
-                status = "No EXR files"
-                color = "gray"
-            elif shot.conversion_progress == 1.0:
-                status = "✅ Complete"
-                color = "green"
-            elif shot.conversion_progress > 0:
-                status = f"🔄 {shot.sbs_frames}/{shot.frames} ({shot.conversion_progress:.0%})"
-                color = "orange"
-            else:
-                status = "⏳ Not started"
-                color = "red"
-            
-            label_text = f"{shot.name} - {status}"
-            label = ttk.Label(shot_frame, text=label_text, foreground=color, cursor="hand2")
-            label.grid(row=0, column=1, sticky=tk.W)
-
-            # Dropbox status
-            if shot.dropbox_status == "Complete":
-                progress_text = f"{shot.sbs_frames}/{shot.sbs_frames}"
-                style = "blue.TLabel" if shot.is_moved else "black.TLabel"
-            else:
-                progress_text = f"{int(shot.dropbox_progress * shot.frames)}/{shot.frames}"
-                style = "black.TLabel"
-            
-            status_label = ttk.Label(shot_frame, text=progress_text, style=style)
-            status_label.grid(row=0, column=2, sticky=tk.E, padx=10)
-            
-            # Bind click event to the frame, label, and checkbox
-            widgets = [shot_frame, label, cb, status_label]
-            for widget in widgets:
-                widget.bind("<Button-1>", lambda e, s=shot, sf=shot_frame: self._on_shot_select(s, sf))
-
-            self.shot_vars.append(var)
-        if self.shots:
-            self.update_preview(self.shots[0])
+        for shot in shots:
+            row = self._shot_rows.get(shot.path)
+            if row is None:
+                row = self._create_shot_row(shot)
+                self._shot_rows[shot.path] = row
+            self._configure_shot_row(row, shot)
+
+        # Re-pack only when rows were added or reordered.
+        order = [shot.path for shot in shots]
+        if order != [p for p in previous_order if p in self._shots_by_path]:
+            for path in order:
+                self._shot_rows[path][0].pack_forget()
+            for path in order:
+                self._shot_rows[path][0].pack(fill=tk.X, pady=2, padx=5)
+
+        self.shot_vars = [self._shot_rows[path][1] for path in order]
+        if reset_preview:
+            self._schedule_preview(self.shots[0])
+
+    def _new_shots_inner(self) -> None:
+        """(Re)create the frame holding the shot rows inside the canvas.
+
+        Destroying the old frame tears down all of its rows in one call,
+        which is much cheaper than destroying hundreds of rows one by one.
+        """
+        if self._shots_window is not None:
+            self.shots_inner.destroy()
+        self.shots_inner = ttk.Frame(self.shots_canvas)
+        self.shots_inner.bind(
+            "<Configure>", lambda e: self.shots_canvas.configure(scrollregion=self.shots_canvas.bbox("all"))
+        )
+        if self._shots_window is None:
+            self._shots_window = self.shots_canvas.create_window((0, 0), window=self.shots_inner, anchor="nw")
+        else:
+            self.shots_canvas.itemconfigure(self._shots_window, window=self.shots_inner)
+        self._shot_rows = {}
+        self._shot_row_shots = {}
+        self._shots_placeholder = None
+
+    def _set_shots_placeholder(self, text: str | None) -> None:
+        """Show ``text`` in place of the shot list, or remove the placeholder."""
+        if self._shots_placeholder is not None:
+            self._shots_placeholder.destroy()
+            self._shots_placeholder = None
+        if text is not None:
+            self._shots_placeholder = ttk.Label(self.shots_inner, text=text)
+            self._shots_placeholder.pack(pady=10)
+
+    def _create_shot_row(self, shot: Shot) -> tuple:
+        """Create the widgets for one shot row; returns (frame, var, cb, label, status_label)."""
+        var = tk.BooleanVar(value=shot.needs_conversion)
+
+        shot_frame = ttk.Frame(self.shots_inner)
+        # Configure the grid columns. Column 1 should expand.
+        shot_frame.columnconfigure(1, weight=1)
+        shot_frame.columnconfigure(2, minsize=120) # Give status column a fixed width
+
+        cb = ttk.Checkbutton(shot_frame, variable=var)
+        cb.grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
+
+        label = ttk.Label(shot_frame, cursor="hand2")
+        label.grid(row=0, column=1, sticky=tk.W)
+
+        status_label = ttk.Label(shot_frame)
+        status_label.grid(row=0, column=2, sticky=tk.E, padx=10)
+
+        # Bind click event to the frame, label, and checkbox. The shot is looked
+        # up on click so the binding stays valid across refreshes.
+        path = shot.path
+        for widget in (shot_frame, label, cb, status_label):
+            widget.bind("<Button-1>", lambda e, p=path, sf=shot_frame: self._on_shot_select(self._shots_by_path[p], sf))
+
+        return shot_frame, var, cb, label, status_label
+
+    def _configure_shot_row(self, row: tuple, shot: Shot) -> None:
+        """Refresh a shot row's checkbox state and status text.
+
+        Rows whose shot is unchanged since the last refresh are left alone.
+        """
+        if self._shot_row_shots.get(shot.path) == shot:
+            return
+        self._shot_row_shots[shot.path] = shot
+        _, _, cb, label, status_label = row
+        cb.state(["disabled"] if shot.is_moved else ["!disabled"])
+
+        # Create detailed status label
+        status, color = SHOT_STATUS_STYLES[shot_status_key(shot)]
+        if status is None:
+            status = f"🔄 {shot.sbs_frames}/{shot.frames} ({shot.conversion_progress:.0%})"
+        label.configure(text=f"{shot.name} - {status}", foreground=color)
+
+        # Dropbox status
+        if shot.dropbox_status == "Complete":
+            progress_text = f"{shot.sbs_frames}/{shot.sbs_frames}"
+            style = "blue.TLabel" if shot.is_moved else "black.TLabel"
+        else:
+            progress_text = f"{int(shot.dropbox_progress * shot.frames)}/{shot.frames}"
+            style = "black.TLabel"
+        status_label.configure(text=progress_text, style=style)
 
     def _open_dropbox_url(self, shot: Shot) -> None:
         """Open a placeholder Dropbox URL in the default web browser."""
         # This is a placeholder. In a real implementation, you would get the URL from the Dropbox API.
         url = f"https://www.dropbox.com/sh/{shot.name.lower().replace(' ', '-')}/?dl=0"
-        try:
-            webbrowser.open(url)
-        except Exception as e:
-            messagebox.showerror("Failed to open URL", f"Could not open the URL:\n{url}\n\nError: {e}")
+        self._run_in_background(
+            webbrowser.open, url, error_title="Failed to open URL", error_prefix=f"Could not open the URL:\n{url}\n\nError: "
+        )
+
+    def _run_in_background(self, func, *args, error_title: str, error_prefix: str = "") -> None:
+        """Call ``func(*args)`` on a daemon thread and report failures in a dialog.
+
+        Used for launching the browser or file explorer, which can block
+        the Tk thread for a noticeable moment on Windows, and for
+        rendering single-channel previews.
+        """
+        def run() -> None:
+            try:
+                func(*args)
+            except Exception as e:
+                self.queue.put(("error", error_title, f"{error_prefix}{e}"))
+
+        threading.Thread(target=run, daemon=True).start()
 
     def select_all(self) -> None:
         for var, shot in zip(self.shot_vars, self.shots):
@@ -541,12 +1673,60 @@ class ConverterGUI(tk.Tk):
             self.move_selected_btn.config(state=tk.NORMAL)
 
     def _live_mode_worker(self) -> None:
-        """Periodically triggers a folder refresh when in live mode."""
-        while self.live_mode_active.get():
-            if hasattr(self, 'current_folder') and self.current_folder and not self.scanning:
-                self.refresh_folder()
-            
-            time.sleep(15) # Wait 15 seconds before the next scan
+        """Periodically triggers a folder refresh when in live mode.
+
+        Without watchdog the folder is rescanned every ``LIVE_MODE_INTERVAL``
+        seconds. With it, only file changes trigger a rescan, but still no
+        more often than that; quiet intervals just re-check the known
+        shots for auto-moves, which depend on how long a shot has been
+        idle.
+        """
+        changed = threading.Event()
+        changed.set()  # scan once straight away
+        last_scan = float("-inf")
+        observer = None
+        watched = None
+        if Observer is not None:
+            observer = Observer()
+            observer.start()
+        try:
+            while self.live_mode_active.get():
+                folder = getattr(self, 'current_folder', None)
+                if observer is not None and folder != watched:
+                    observer.unschedule_all()
+                    watched = folder
+                    changed.set()
+                    last_scan = float("-inf")
+                    if folder:
+                        try:
+                            observer.schedule(_ChangeFlag(changed, folder), folder, recursive=True)
+                        except OSError:
+                            observer.stop()
+                            observer = None  # fall back to polling
+                # Back off on slow shares so scans never take up more than
+                # half of live mode's time.
+                interval = max(LIVE_MODE_INTERVAL, 2 * self._last_scan_duration)
+                if folder and not self._scan_in_flight.is_set():
+                    due = time.monotonic() - last_scan >= interval
+                    if observer is None or (changed.is_set() and due):
+                        changed.clear()
+                        last_scan = time.monotonic()
+                        # Rescan without clearing the frame-count cache, so
+                        # idle shots are not re-listed every tick.
+                        self.load_folder_from_path(folder)
+                    else:
+                        self.queue.put(("live_tick",))
+
+                if observer is None:
+                    time.sleep(interval)
+                elif changed.is_set():
+                    # A change is waiting for the gap since the last scan.
+                    time.sleep(max(LIVE_MODE_DEBOUNCE, last_scan + interval - time.monotonic()))
+                elif changed.wait(interval):
+                    time.sleep(LIVE_MODE_DEBOUNCE)  # let a burst of writes settle
+        finally:
+            if observer is not None:
+                observer.stop()
 
     def _handle_auto_processing(self, shots: List[Shot]) -> None:
         """Automatically convert and move shots based on their status and render activity."""
@@ -554,16 +1734,11 @@ class ConverterGUI(tk.Tk):
             return
 
         # --- Auto Conversion ---
-        is_converting = self.convert_btn.cget('state') == tk.DISABLED
-        if not is_converting:
-            shots_to_convert = [s for s in shots if s.needs_conversion]
-            if shots_to_convert:
-                self.queue.put(("log", f"Live mode: Found {len(shots_to_convert)} shot(s) needing conversion. Starting..."))
-                threading.Thread(
-                    target=self._convert_worker,
-                    args=(shots_to_convert, self.oiiotool),
-                    daemon=True,
-                ).start()
+        # Shots already being converted are skipped; new ones join the
+        # running conversion if there is one.
+        shots_to_convert = [s for s in shots if s.needs_conversion]
+        if shots_to_convert and self._enqueue_conversion(shots_to_convert, self.oiiotool):
+            self.queue.put(("log", f"Live mode: Found {len(shots_to_convert)} shot(s) needing conversion. Starting..."))
 
         # --- Auto Move Logic ---
         now = time.time()
@@ -575,26 +1750,33 @@ class ConverterGUI(tk.Tk):
                 continue
 
             try:
-                frame_files = sorted([os.path.join(shot.path, f) for f in os.listdir(shot.path) if f.lower().endswith(".exr")])
-                if len(frame_files) < 2: # Need at least 2 frames to calculate a delta
+                with os.scandir(shot.path) as it:
+                    frames = [
+                        entry for entry in it
+                        if _classify(entry.name) and entry.is_file()
+                    ]
+                if len(frames) < 2: # Need at least 2 frames to calculate a delta
                     continue
 
-                # Calculate average time delta between frames
-                timestamps = [os.path.getmtime(f) for f in frame_files]
-                deltas = [timestamps[i] - timestamps[i-1] for i in range(1, len(timestamps))]
-                avg_delta = sum(deltas) / len(deltas) if deltas else 0
+                # The deltas between consecutive frames telescope, so their
+                # mean only needs the first and last frame (by name): no
+                # sort and no per-frame mtime.
+                first = min(frames, key=lambda entry: entry.name)
+                last = max(frames, key=lambda entry: entry.name)
+                last_mtime = last.stat().st_mtime
+                avg_delta = (last_mtime - first.stat().st_mtime) / (len(frames) - 1)
 
                 # Determine the required delay
                 adaptive_delay = avg_delta * self.frame_time_multiplier.get()
                 required_delay = max(self.min_delay.get(), adaptive_delay)
                 
-                time_since_last_frame = now - timestamps[-1]
+                time_since_last_frame = now - last_mtime
 
                 if time_since_last_frame > required_delay:
                     shots_ready_to_move.append(shot)
                     self.queue.put(("log", f"Shot {shot.name} appears complete. (Idle for {time_since_last_frame:.0f}s > {required_delay:.0f}s)"))
 
-            except (FileNotFoundError, ValueError, IndexError):
+            except (OSError, ValueError, IndexError):
                 continue # Folder might be empty or files disappeared
 
         if shots_ready_to_move:
@@ -664,18 +1846,23 @@ class ConverterGUI(tk.Tk):
         try:
             for entry in os.scandir(folder):
                 if entry.is_dir() and entry.name.endswith("_SBS"):
-                    sbs_dir = entry.path
-                    for sub_entry in os.scandir(sbs_dir):
-                        if sub_entry.is_file() and sub_entry.name.startswith("tmp") and sub_entry.name.endswith(".exr"):
-                            try:
-                                file_path = sub_entry.path
-                                file_age = now - os.path.getmtime(file_path)
-                                if file_age > 300:  # 5 minutes
-                                    os.remove(file_path)
-                                    self.queue.put(("log", f"Removed old temp file: {file_path}"))
-                                    cleaned_count += 1
-                            except (OSError, FileNotFoundError) as e:
-                                self.queue.put(("log", f"Error removing temp file {sub_entry.name}: {e}"))
+                    # A running batch renames its outputs only when the
+                    # whole oiiotool call is done, which can take longer
+                    # than the age limit, so leave shots being converted
+                    # alone.
+                    with self._convert_lock:
+                        owned = {os.path.normcase(path) for path in self._converting}
+                    if os.path.normcase(entry.path[:-len("_SBS")]) in owned:
+                        continue
+                    for temp in _iter_temp_entries(entry.path):
+                        try:
+                            file_age = now - temp.stat().st_mtime
+                            if file_age > 300:  # 5 minutes
+                                os.remove(temp.path)
+                                self.queue.put(("log", f"Removed old temp file: {temp.path}"))
+                                cleaned_count += 1
+                        except (OSError, FileNotFoundError) as e:
+                            self.queue.put(("log", f"Error removing temp file {temp.name}: {e}"))
         except (OSError, FileNotFoundError) as e:
             self.queue.put(("log", f"Error during cleanup scan: {e}"))
         
@@ -685,128 +1872,144 @@ class ConverterGUI(tk.Tk):
             self.queue.put(("log", "🧹 Cleanup finished. No old temp files found."))
 
     # Conversion ---------------------------------------------------------
+    def refresh_oiiotool(self) -> str | None:
+        """Forget the cached oiiotool lookup and search again.
+
+        The path saved by earlier launches is ignored too, so a newly
+        installed or moved oiiotool is picked up.
+        """
+        find_oiiotool.cache_clear()
+        oiiotool_version.cache_clear()
+        self.oiiotool = find_oiiotool(use_saved=False)
+        return self.oiiotool
+
+    @contextmanager
+    def _cpu_monitoring(self, interval: float = 1.0) -> Iterator[None]:
+        """Post a ``cpu`` message every ``interval`` seconds while active."""
+        stop = threading.Event()
+
+        def monitor() -> None:
+            meter = CpuMeter()
+            while not stop.wait(interval):
+                self.queue.put(("cpu", meter.sample()))
+
+        threading.Thread(target=monitor, daemon=True).start()
+        try:
+            yield
+        finally:
+            stop.set()
+
+    def _job_count(self) -> int:
+        """Parallel conversion jobs: the user's setting, at most one per core.
+
+        The spinbox stops at the core count, but a typed-in value doesn't;
+        more oiiotool processes than cores only adds context switching.
+        """
+        return max(1, min(self.max_workers.get(), os.cpu_count() or 1))
+
+    def _snapshot_opts(self) -> tuple[str, str]:
+        """Read the pixel type and compression once for a whole conversion run."""
+        return self.datatype.get(), self.compression.get()
+
+    def _report_oiiotool(self) -> None:
+        """Log which oiiotool (and version) conversions will use."""
+        if not self.oiiotool:
+            if oiio is not None:
+                self.queue.put(("log", "oiiotool not found; converting with the OpenImageIO Python bindings."))
+            else:
+                self.queue.put(("log", "oiiotool not found. Install OpenImageIO tools to convert."))
+            return
+        version = ".".join(map(str, oiiotool_version(self.oiiotool))) or "unknown version"
+        self.queue.put(("log", f"Using oiiotool {version} at {self.oiiotool}"))
+
+    def _current_oiiotool(self) -> str | None:
+        """Return the cached oiiotool path, re-detecting it if it is missing."""
+        if self.oiiotool and os.path.exists(self.oiiotool):
+            return self.oiiotool
+        return self.refresh_oiiotool()
+
     def start_convert(self) -> None:
-        # Run a cleanup pass before starting a new conversion
+        # Run a cleanup pass before starting a new conversion. It walks every
+        # _SBS tree, so keep it off the Tk thread; it only removes temp files
+        # older than 5 minutes and can't touch this run's outputs.
         if hasattr(self, 'current_folder') and self.current_folder:
             self.queue.put(("log", "Running pre-conversion cleanup..."))
-            self._cleanup_temp_files(self.current_folder)
+            threading.Thread(
+                target=self._cleanup_temp_files,
+                args=(self.current_folder,),
+                daemon=True,
+            ).start()
 
         selected = [s for s, v in zip(self.shots, self.shot_vars) if v.get() and s.needs_conversion]
         if not selected:
             messagebox.showinfo("Nothing to convert", "No shots selected for conversion.")
             return
-        oiiotool = find_oiiotool()
-        if not oiiotool:
+        oiiotool = self._current_oiiotool()
+        if not oiiotool and oiio is None:
             messagebox.showerror(
                 "Missing dependency",
                 "Could not find oiiotool executable.\nPlease install OpenImageIO tools.",
             )
             return
-        self.oiiotool = oiiotool
-        self.convert_btn.config(state=tk.DISABLED)
-        threading.Thread(
-            target=self._convert_worker,
-            args=(selected, oiiotool),
-            daemon=True,
-        ).start()
-
-    def _convert_worker(self, shots: List[Shot], oiiotool: str) -> None:
-        total_frames = sum(self._frame_count(s.path) for s in shots)
-        done = 0
-        start_time = time.time()
-        if psutil:
-            psutil.cpu_percent()
-        self.queue.put(("overall", done, total_frames))
-        
-        max_workers = self.max_workers.get()
-        semaphore = threading.Semaphore(max_workers)
-
-        def process(shot: Shot, frame_rel_path: str, outdir: str) -> tuple[str, str, int, str]:
-            """Process a single frame, respecting the semaphore."""
-            with semaphore:
-                src = os.path.join(shot.path, frame_rel_path)
-                dst = os.path.join(outdir, frame_rel_path.replace(".exr", "_SBS.exr"))
-                
-                # Ensure the destination directory exists
-                os.makedirs(os.path.dirname(dst), exist_ok=True)
-
-                try:
-                    with tempfile.NamedTemporaryFile(suffix=".exr", dir=os.path.dirname(dst), delete=False) as tmp:
-                        temp_dst = tmp.name
-                except Exception as e:
-                    return shot.name, frame_rel_path, -1, f"Failed to create temp file: {e}"
-
-                cmd = [
-                    oiiotool,
-                    src,
-                    "--fullpixels",
-                    "-d",
-                    self.datatype.get(),
-                    "--compression",
-                    self.compression.get(),
-                    "-o",
-                    temp_dst,
-                ]
-                
-                try:
-                    result = subprocess.run(
-                        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=False
-                    )
-                    
-                    if result.returncode != 0:
-                        return shot.name, frame_rel_path, result.returncode, result.stderr.strip()
-                    else:
-                        os.rename(temp_dst, dst)
-                        return shot.name, frame_rel_path, 0, ""
-                except Exception as e:
-                    return shot.name, frame_rel_path, -1, str(e)
-                finally:
-                    if os.path.exists(temp_dst):
-                        try:
-                            os.remove(temp_dst)
-                        except OSError:
-                            pass # Ignore errors on temp file removal
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = []
-            for shot in shots:
-                frames = self._frame_list(shot.path)
-                if not frames:
-                    self.queue.put(("log", f"{shot.name}: No frames to convert (already complete?)"))
-                    continue
-
-                outdir = f"{shot.path}_SBS"
-                os.makedirs(outdir, exist_ok=True)
-
-                self.queue.put(("shot", shot.name, 0, len(frames)))
-                self.queue.put(("log", f"{shot.name}: Converting {len(frames)} frames..."))
-                for frame in frames:
-                    futures.append(executor.submit(process, shot, frame, outdir))
-
-            shot_progress = {shot.name: {"done": 0, "total": len(self._frame_list(shot.path))} for shot in shots}
-
-            for future in as_completed(futures):
-                shot_name, frame_rel_path, retcode, stderr = future.result()
-                
-                if retcode != 0:
-                    self.queue.put(("log", f"{shot_name}: {frame_rel_path} failed - {stderr}"))
-                else:
-                    self.queue.put(("log", f"{shot_name}: {frame_rel_path} ✅"))
-                
-                done += 1
-                shot_progress[shot_name]["done"] += 1
-                self.queue.put(("shot", shot_name, shot_progress[shot_name]["done"], shot_progress[shot_name]["total"]))
-                self.queue.put(("overall", done, total_frames))
-                
-                if psutil:
-                    self.queue.put(("cpu", psutil.cpu_percent()))
-                if done:
-                    elapsed = time.time() - start_time
-                    eta = (total_frames - done) * (elapsed / done)
-                    self.queue.put(("eta", eta))
+        running = self._convert_queue is not None
+        added = self._enqueue_conversion(selected, oiiotool)
+        if running:
+            self.queue.put(("log", f"Added {added} shot(s) to the running conversion."))
+
+    def _enqueue_conversion(self, shots: List[Shot], oiiotool: str | None) -> int:
+        """Convert ``shots``, joining the running conversion if there is one.
+
+        Shots already part of the running conversion are skipped. Returns
+        the number of shots added.
+        """
+        with self._convert_lock:
+            shots = [s for s in shots if s.path not in self._converting]
+            self._converting.update(s.path for s in shots)
+            if self._convert_queue is not None:
+                self._convert_queue.extend(shots)
+                return len(shots)
+            if shots:
+                self._convert_queue = []
+                threading.Thread(
+                    target=self._convert_worker,
+                    args=(shots, oiiotool),
+                    daemon=True,
+                ).start()
+            return len(shots)
+
+    def _take_queued_shots(self, finish: bool = False) -> List[Shot]:
+        """Shots added to the running conversion since the last call.
+
+        With ``finish``, an empty result also ends the run, so shots added
+        after that start a new conversion instead.
+        """
+        with self._convert_lock:
+            shots, self._convert_queue = self._convert_queue or [], []
+            if finish and not shots:
+                self._convert_queue = None
+                self._converting.clear()
+            return shots
+
+    def _convert_worker(self, shots: List[Shot], oiiotool: str | None) -> None:
+        completed = False
+        try:
+            shots, failed_shots = self._run_conversion(shots, oiiotool)
+            completed = True
+        except Exception as e:
+            self.queue.put(("log", f"❌ Conversion stopped: {e}"))
+        finally:
+            if not completed:
+                # A finished run has already unregistered itself. A failed
+                # one must too, or later shots would queue up behind a
+                # worker that no longer exists.
+                with self._convert_lock:
+                    self._convert_queue = None
+                    self._converting.clear()
+        if not completed:
+            self.queue.put(("refresh_request",))
+            return
 
         self.queue.put(("log", "🎉 All conversions complete!"))
-        self.queue.put(("done",))
 
         # Auto-move completed shots
         self.queue.put(("log", "Checking for completed shots to auto-move..."))
@@ -814,13 +2017,15 @@ class ConverterGUI(tk.Tk):
         shots_to_move = []
         for shot in shots:
             shot_status = statuses.get(shot.name, {})
-            # Refresh shot data from disk/status file
-            sbs_frames = sbs_frame_count(f"{shot.path}_SBS")
-            frames = frame_count(shot.path)
-            
-            if sbs_frames == frames and shot_status.get("dropbox_status") == "Complete":
-                if not shot_status.get("is_moved"):
-                    shots_to_move.append(shot)
+            # A shot with failed frames can't be complete, and the status
+            # checks are free, so only count frames when they all pass.
+            if shot.name in failed_shots or shot_status.get("is_moved"):
+                continue
+            if shot_status.get("dropbox_status") != "Complete":
+                continue
+            # Refresh shot data from disk
+            if sbs_frame_count(f"{shot.path}_SBS") == frame_count(shot.path):
+                shots_to_move.append(shot)
 
         if shots_to_move:
             self.queue.put(("log", f"Found {len(shots_to_move)} shots to move automatically."))
@@ -830,34 +2035,242 @@ class ConverterGUI(tk.Tk):
         
         self.queue.put(("refresh_request",))
 
-    def _frame_list(self, path: str) -> List[str]:
-        """Get list of relative paths for frames that need conversion."""
-        source_frames = []
-        for root, _, files in os.walk(path):
-            for f in files:
-                if f.lower().endswith(".exr") and "_SBS" not in f:
-                    # Create a relative path from the base 'path'
-                    relative_path = os.path.relpath(os.path.join(root, f), path)
-                    source_frames.append(relative_path)
-        
-        source_frames.sort()
+    def _run_conversion(self, shots: List[Shot], oiiotool: str | None) -> tuple[List[Shot], Set[str]]:
+        """Convert ``shots`` plus any added while running.
 
-        sbs_path = f"{path}_SBS"
-        if not os.path.exists(sbs_path):
-            return source_frames
+        Returns every shot of the run and the names of those with failed
+        frames. Ends the run (see ``_take_queued_shots``) before returning.
+        """
+        total_frames = 0
+        done = 0
+        start_time = time.monotonic()
+        max_workers = self._job_count()
+        # Cap oiiotool's own thread pool so N jobs don't each spin up a
+        # thread per core, and give each job an even share of the image
+        # cache budget instead of the small default.
+        threads = max(1, self.oiio_threads.get())
+        env = {**os.environ, "OPENIMAGEIO_THREADS": str(threads)}
+        tool_args = ["--threads", str(threads)]
+        if self.memory_mb:
+            cache_mb = int(self.memory_mb * IMAGECACHE_RAM_FRACTION / max_workers)
+            tool_args += ["--cache", str(max(256, cache_mb))]
+        if oiio is not None:
+            oiio.attribute("threads", threads)
+        # oiiotool 2.5+ can convert a numbered range itself and overlap the
+        # frames with --parallel-frames.
+        use_sequences = bool(oiiotool) and oiio is None and oiiotool_version(oiiotool) >= (2, 5)
+
+        datatype, compression = self._snapshot_opts()
+
+        def frame_args(src: str, dst: str, codec: str) -> List[str]:
+            return [src, "--fullpixels", "-d", datatype, "--compression", codec, "-o", dst]
+
+        def process(shot: Shot, frame_rel_paths: List[str], outdir: str) -> List[tuple[str, str, int, str]]:
+            """Convert a batch of frames with one oiiotool call.
+
+            If the batch fails, its frames are retried one at a time so each
+            frame still gets its own result and error message.
+            """
+            results = []
+            jobs = []  # (frame_rel_path, src, dst, temp_dst)
+            # Plain concatenation is enough for the relative paths that
+            # _frame_list returns and is cheaper than os.path.join per frame.
+            src_prefix = os.path.join(shot.path, "")
+            dst_prefix = os.path.join(outdir, "")
+            for frame_rel_path in frame_rel_paths:
+                src = src_prefix + frame_rel_path
+                dst = dst_prefix + sbs_frame_name(frame_rel_path)
+
+                # Ensure the destination directory exists (once per run);
+                # if it can't be created, that frame fails on its own.
+                dst_dir = os.path.dirname(dst)
+                if dst_dir not in made_dirs:
+                    try:
+                        os.makedirs(dst_dir, exist_ok=True)
+                    except OSError as e:
+                        results.append((shot.name, frame_rel_path, -1, str(e)))
+                        continue
+                    made_dirs.add(dst_dir)
+                jobs.append((frame_rel_path, src, dst, part_name(dst)))
+
+            # A shot's frames share one layout, so "auto" is resolved from
+            # the first frame of the batch.
+            codec = resolve_compression(compression, jobs[0][1]) if jobs else compression
 
-        # Filter out frames that are already converted
-        unconverted_frames = []
-        for frame_rel_path in source_frames:
-            # Construct the expected output path
-            sbs_file_path = os.path.join(sbs_path, frame_rel_path.replace(".exr", "_SBS.exr"))
-            if not os.path.exists(sbs_file_path):
-                unconverted_frames.append(frame_rel_path)
-        
-        return unconverted_frames
+            try:
+                if oiio is not None:
+                    # In-process conversion: no oiiotool startup per
+                    # frame, and OIIO releases the GIL while working.
+                    for frame_rel_path, src, dst, temp_dst in jobs:
+                        try:
+                            error = convert_frame_oiio(src, temp_dst, datatype, codec)
+                            if not error:
+                                os.replace(temp_dst, dst)
+                            results.append((shot.name, frame_rel_path, -1 if error else 0, error))
+                        except Exception as e:
+                            results.append((shot.name, frame_rel_path, -1, str(e)))
+                    return results
+
+                if len(jobs) > 1:
+                    # One process for the whole batch: a contiguous run is
+                    # passed as a frame range, anything else as a chain of
+                    # inputs where --pop drops each image after writing.
+                    sequence = frame_sequence([job[0] for job in jobs]) if use_sequences else None
+                    if sequence:
+                        pattern, first, last = sequence
+                        cmd = [oiiotool, *tool_args, "--frames", f"{first}-{last}", "--parallel-frames"] + frame_args(
+                            src_prefix + pattern, part_name(dst_prefix + sbs_frame_name(pattern)), codec
+                        )
+                    else:
+                        cmd = [oiiotool, *tool_args]
+                        for _, src, _, temp_dst in jobs:
+                            cmd += frame_args(src, temp_dst, codec) + ["--pop"]
+                    try:
+                        # A failed batch is retried frame by frame below,
+                        # which is where errors get reported, so the batch's
+                        # own output is never read.
+                        result = subprocess.run(
+                            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False, env=env
+                        )
+                    except OSError:
+                        result = None
+                    if result is not None and result.returncode == 0:
+                        for frame_rel_path, _, dst, temp_dst in jobs:
+                            try:
+                                os.replace(temp_dst, dst)
+                                results.append((shot.name, frame_rel_path, 0, ""))
+                            except OSError as e:
+                                results.append((shot.name, frame_rel_path, -1, str(e)))
+                        return results
+
+                for frame_rel_path, src, dst, temp_dst in jobs:
+                    try:
+                        result = subprocess.run(
+                            [oiiotool, *tool_args] + frame_args(src, temp_dst, codec),
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=False, env=env
+                        )
+
+                        if result.returncode != 0:
+                            # stderr is kept as bytes and only decoded when
+                            # it's actually reported.
+                            error = result.stderr.decode("utf-8", "replace").strip()
+                            results.append((shot.name, frame_rel_path, result.returncode, error))
+                        else:
+                            os.replace(temp_dst, dst)
+                            results.append((shot.name, frame_rel_path, 0, ""))
+                    except Exception as e:
+                        results.append((shot.name, frame_rel_path, -1, str(e)))
+                return results
+            finally:
+                # Converted frames were renamed already; only failed or
+                # interrupted ones can leave a temp file behind.
+                converted = {frame_rel_path for _, frame_rel_path, retcode, _ in results if retcode == 0}
+                for frame_rel_path, _, _, temp_dst in jobs:
+                    if frame_rel_path in converted:
+                        continue
+                    try:
+                        os.unlink(temp_dst)
+                    except OSError:
+                        pass # Never written
+
+        shot_progress: Dict[str, dict] = {}
+        failed_shots = set()
+        # Output directories created so far, shared by all batches. At
+        # worst two batches both call makedirs for a new directory.
+        made_dirs: Set[str] = set()
+
+        def submit(executor, new_shots: List[Shot]) -> Set:
+            """Queue the pending frames of ``new_shots``; returns their futures."""
+            nonlocal total_frames
+            futures = set()
+            for shot in new_shots:
+                # List each shot's pending frames once.
+                frames = self._frame_list(shot.path)
+                if not frames:
+                    self.queue.put(("log", f"{shot.name}: No frames to convert (already complete?)"))
+                    continue
+
+                # process() creates the output directories as needed.
+                outdir = f"{shot.path}_SBS"
+
+                total_frames += len(frames)
+                shot_progress[shot.name] = {"done": 0, "total": len(frames)}
+                self.queue.put(("shot", shot.name, 0, len(frames)))
+                self.queue.put(("log", f"{shot.name}: Converting {len(frames)} frames..."))
+                # Batch frames per oiiotool call, but keep ~4 batches per
+                # worker so the tail of the shot stays balanced.
+                batch_size = max(1, min(FRAMES_PER_BATCH, len(frames) // (max_workers * 4)))
+                for batch in _chunks(frames, batch_size):
+                    futures.add(executor.submit(process, shot, batch, outdir))
+            self.queue.put(("overall", done, total_frames))
+            return futures
+
+        # CPU usage is sampled on its own 1 Hz timer so the meter keeps
+        # moving even while long batches are running.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor, self._cpu_monitoring():
+            pending = submit(executor, shots)
+
+            # Progress is reported once per finished batch and throttled per
+            # kind; completions are always sent so the bars end up full.
+            emitter = _ThrottledEmitter(self.queue, {"eta": 0.5})
+            while True:
+                # Shots selected while this runs join the same pool. The
+                # run only ends once nothing is left to convert and no
+                # more shots were added.
+                more = self._take_queued_shots(finish=not pending)
+                if more:
+                    shots = shots + more
+                    pending |= submit(executor, more)
+                    continue
+                if not pending:
+                    break
+                finished, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    # One log message per finished batch rather than per frame.
+                    lines = []
+                    for shot_name, frame_rel_path, retcode, stderr in future.result():
+                        if retcode != 0:
+                            lines.append(f"{shot_name}: {frame_rel_path} failed - {stderr}")
+                            failed_shots.add(shot_name)
+                        else:
+                            lines.append(f"{shot_name}: {frame_rel_path} ✅")
+
+                        done += 1
+                        shot_progress[shot_name]["done"] += 1
+                    self.queue.put(("log_batch", lines))
+
+                    progress = shot_progress[shot_name]
+                    emitter.emit("shot", shot_name, progress["done"], progress["total"],
+                                 force=progress["done"] == progress["total"])
+                    emitter.emit("overall", done, total_frames, force=done == total_frames)
+
+                    # Only compute the ETA when it would be sent.
+                    if done and emitter.ready("eta"):
+                        elapsed = time.monotonic() - start_time
+                        emitter.emit("eta", (total_frames - done) * (elapsed / done))
+
+        return shots, failed_shots
 
-    def _frame_count(self, path: str) -> int:
-        return len(self._frame_list(path))
+    def _frame_list(self, path: str) -> List[str]:
+        """Get list of relative paths for frames that need conversion."""
+        prefix = os.path.join(path, "")
+        source_frames = sorted(
+            e.path[len(prefix):] for kind, e in _iter_exr_entries(path) if kind == SOURCE_FRAME
+        )
+        if not source_frames:
+            return source_frames  # nothing to filter; skip listing the _SBS tree
+
+        sbs_prefix = os.path.join(f"{path}_SBS", "")
+        # Map every existing output back to its source name once, so the
+        # filter below is a plain set lookup per frame.
+        converted = set()
+        for _, e in _iter_exr_entries(sbs_prefix):
+            rel = e.path[len(sbs_prefix):]
+            if rel[:-4].endswith("_SBS"):
+                converted.add(rel[:-8] + rel[-4:])
+        if not converted:
+            return source_frames
+        return [f for f in source_frames if f not in converted]
 
     def _on_shot_select(self, shot: Shot, shot_frame: ttk.Frame) -> None:
         """Handle shot selection, showing a loading state."""
@@ -871,75 +2284,76 @@ class ConverterGUI(tk.Tk):
         self.thumb_label.configure(image=None)
         self.thumb_label.config(text="Loading...")
         self.layers_list.delete(0, tk.END)
-        
-        # Update preview in a separate thread to avoid blocking the GUI
+
+        self._schedule_preview(shot)
+
+    def _schedule_preview(self, shot: Shot) -> None:
+        """Preview ``shot`` on a background thread after a short delay.
+
+        Debounced: only the last of a quick run of requests starts a
+        preview, and results for superseded ones are dropped.
+        """
+        if self._preview_after is not None:
+            self.after_cancel(self._preview_after)
+        self._preview_token += 1
+        self._preview_after = self.after(PREVIEW_DEBOUNCE_MS, self._launch_preview, shot, self._preview_token)
+
+    def _launch_preview(self, shot: Shot, token: int) -> None:
+        """Update the preview in a separate thread to avoid blocking the GUI."""
+        self._preview_after = None
         threading.Thread(
             target=self.update_preview,
-            args=(shot,),
+            args=(shot, token),
             daemon=True,
         ).start()
 
     # Preview -------------------------------------------------------------
-    def update_preview(self, shot: Shot) -> None:
-        # This now runs in a background thread, so GUI updates must be queued
+    def update_preview(self, shot: Shot, token: int | None = None) -> None:
+        # This now runs in a background thread, so GUI updates must be queued.
+        # ``token`` identifies the selection; once a newer one is made the
+        # result is discarded instead of overwriting the newer preview.
+        def stale() -> bool:
+            return token is not None and token != self._preview_token
         
-        # Clear previous buttons
-        for widget in self.preview_buttons_frame.winfo_children():
-            widget.destroy()
-
         # Determine the correct paths based on whether the shot is moved
         mono_path = shot.path
         sbs_path = os.path.join(shot.moved_path, f"{shot.name}_SBS") if shot.is_moved else f"{shot.path}_SBS"
-
-        # Add new buttons
-        mono_button = ttk.Button(self.preview_buttons_frame, text="Open Mono Folder", command=lambda: self.open_folder(mono_path))
-        mono_button.pack(side=tk.LEFT, padx=5)
-
-        sbs_button = ttk.Button(self.preview_buttons_frame, text="Open SBS Folder", command=lambda: self.open_folder(sbs_path))
-        sbs_button.pack(side=tk.LEFT, padx=5)
-        
-        dropbox_button = ttk.Button(self.preview_buttons_frame, text="Dropbox", command=lambda: self._open_dropbox_url(shot))
-        dropbox_button.pack(side=tk.LEFT, padx=5)
-
-        move_button = ttk.Button(self.preview_buttons_frame, text="Move to Ready for Comp", command=lambda: self._move_shot_to_comp(shot))
-        move_button.pack(side=tk.LEFT, padx=5)
-        if shot.is_moved or shot.needs_conversion or shot.dropbox_status != "Complete":
-            move_button.config(state=tk.DISABLED)
-
-        if not os.path.exists(mono_path):
-            mono_button.config(state=tk.DISABLED)
-        if not os.path.exists(sbs_path):
-            sbs_button.config(state=tk.DISABLED)
+        if stale():
+            return
+        self.queue.put((
+            "preview_buttons", shot, mono_path, sbs_path, os.path.exists(mono_path), os.path.exists(sbs_path),
+        ))
 
         if shot.is_moved:
-            self.queue.put(("preview_update", None, [], shot, ""))
+            if not stale():
+                self.queue.put(("preview_update", None, [], shot, "", {}))
             return
 
         frames = self._frame_list(shot.path)
         if not frames:
-            # Even if there are no frames to convert, we might have a preview
-            source_frames = []
-            try:
-                # Find the first EXR file recursively for preview
-                for root, _, files in os.walk(shot.path):
-                    for f in files:
-                        if f.lower().endswith(".exr") and "_SBS" not in f:
-                            source_frames.append(os.path.join(root, f))
-                            break  # Found one, that's enough
-                    if source_frames:
-                        break
-            except FileNotFoundError:
-                pass # Ignore if folder doesn't exist
-            if not source_frames:
-                self.queue.put(("preview_update", None, [], shot, ""))
+            # Even if there are no frames to convert, we might have a preview:
+            # use the first source EXR file found recursively.
+            frame_path = next(
+                (e.path for kind, e in _iter_exr_entries(shot.path) if kind == SOURCE_FRAME), None
+            )
+            if frame_path is None:
+                if not stale():
+                    self.queue.put(("preview_update", None, [], shot, "", {}))
                 return
-            frame_path = source_frames[0]
         else:
             frame_path = os.path.join(shot.path, frames[0])
-        thumbnail = self._make_thumbnail(frame_path)
-        channels = self._get_channels(frame_path)
-        
-        self.queue.put(("preview_update", thumbnail, channels, shot, frame_path))
+        if stale():
+            return
+        # Show the header's embedded preview, if any, while the real
+        # thumbnail renders.
+        coarse = self._coarse_thumbnail(frame_path)
+        if coarse is not None and not stale():
+            channels, details = read_exr_header(frame_path) or ([], {})
+            self.queue.put(("preview_update", coarse, channels, shot, frame_path, details))
+        thumbnail, channels, details = self._thumbnail_and_info(frame_path)
+
+        if not stale():
+            self.queue.put(("preview_update", thumbnail, channels, shot, frame_path, details))
         
     def _move_shot_to_comp(self, shot: Shot) -> None:
         """Move the shot's SBS folder to the 'Ready for Comp' directory."""
@@ -976,7 +2390,62 @@ class ConverterGUI(tk.Tk):
         except Exception as e:
             messagebox.showerror("Move Failed", f"An error occurred while moving the shot: {e}")
 
-    def _update_preview_ui(self, thumbnail, channels, shot, frame_path):
+    def _show_preview_buttons(self, shot: Shot, mono_path: str, sbs_path: str, mono_exists: bool, sbs_exists: bool) -> None:
+        """Replace the preview buttons with ones for ``shot``."""
+        for widget in self.preview_buttons_frame.winfo_children():
+            widget.destroy()
+
+        mono_button = ttk.Button(self.preview_buttons_frame, text="Open Mono Folder", command=lambda: self.open_folder(mono_path))
+        mono_button.pack(side=tk.LEFT, padx=5)
+
+        sbs_button = ttk.Button(self.preview_buttons_frame, text="Open SBS Folder", command=lambda: self.open_folder(sbs_path))
+        sbs_button.pack(side=tk.LEFT, padx=5)
+        
+        dropbox_button = ttk.Button(self.preview_buttons_frame, text="Dropbox", command=lambda: self._open_dropbox_url(shot))
+        dropbox_button.pack(side=tk.LEFT, padx=5)
+
+        move_button = ttk.Button(self.preview_buttons_frame, text="Move to Ready for Comp", command=lambda: self._move_shot_to_comp(shot))
+        move_button.pack(side=tk.LEFT, padx=5)
+        if shot.is_moved or shot.needs_conversion or shot.dropbox_status != "Complete":
+            move_button.config(state=tk.DISABLED)
+
+        if not mono_exists:
+            mono_button.config(state=tk.DISABLED)
+        if not sbs_exists:
+            sbs_button.config(state=tk.DISABLED)
+
+    def _photo_image(self, thumbnail) -> tk.PhotoImage | None:
+        """Build the Tk image for a queued ``(key, data, zoom)`` thumbnail.
+
+        Tk images must be created on the main thread, so preview workers
+        only hand over the encoded bytes. Images with a ``key`` are kept in
+        ``_thumb_cache``, so a revisited frame reuses its decoded image
+        rather than creating (and later destroying) another one.
+        """
+        if thumbnail is None:
+            return None
+        key, data, zoom = thumbnail
+        image = self._thumb_cache.get(key) if key else None
+        if image is not None:
+            self._thumb_cache.move_to_end(key)
+            return image
+        if not data:
+            return None
+        try:
+            image = tk.PhotoImage(data=data)
+        except tk.TclError:
+            return None
+        if zoom:
+            factor = THUMBNAIL_SIZE // max(image.width(), image.height())
+            if factor > 1:
+                image = image.zoom(factor)
+        if key:
+            self._thumb_cache[key] = image
+            while len(self._thumb_cache) > THUMBNAIL_CACHE_SIZE:
+                self._thumb_cache.popitem(last=False)
+        return image
+
+    def _update_preview_ui(self, thumbnail, channels, shot, frame_path, details):
         """Update the preview UI from the main thread."""
         self.current_frame = frame_path
         self.thumb_label.config(text="") # Clear loading text
@@ -985,9 +2454,10 @@ class ConverterGUI(tk.Tk):
             self.thumb_label.configure(image=None)
             self.thumb_label.config(text="Shot has been moved.")
             self.layers_list.delete(0, tk.END)
-            self._update_shot_details(shot, "")
+            self._update_shot_details(shot, {})
             return
 
+        thumbnail = self._photo_image(thumbnail)
         if thumbnail:
             self.thumbnail = thumbnail
             self.thumb_label.configure(image=self.thumbnail)
@@ -1000,9 +2470,9 @@ class ConverterGUI(tk.Tk):
             self.layers_list.insert(tk.END, c)
 
         # Update shot details
-        self._update_shot_details(shot, frame_path)
+        self._update_shot_details(shot, details)
 
-    def _update_shot_details(self, shot: Shot, frame_path: str) -> None:
+    def _update_shot_details(self, shot: Shot, details: dict) -> None:
         """Update the shot details frame."""
         for widget in self.shot_details_frame.winfo_children():
             widget.destroy()
@@ -1018,7 +2488,6 @@ class ConverterGUI(tk.Tk):
         status = "Complete" if shot.conversion_progress == 1.0 else "Incomplete"
         ttk.Label(self.shot_details_frame, text=f"Conversion: {status}").pack(anchor=tk.W)
         
-        details = self._get_shot_details(frame_path)
         if details:
             ttk.Label(self.shot_details_frame, text=f"Compression: {details.get('compression', 'N/A')}").pack(anchor=tk.W)
             ttk.Label(self.shot_details_frame, text=f"Resolution: {details.get('resolution', 'N/A')}").pack(anchor=tk.W)
@@ -1029,131 +2498,155 @@ class ConverterGUI(tk.Tk):
         if not os.path.exists(path):
             messagebox.showerror("Folder not found", f"The folder '{path}' does not exist.")
             return
-        try:
+
+        def open_path() -> None:
             if platform.system() == "Windows":
                 os.startfile(path)
             elif platform.system() == "Darwin":  # macOS
                 subprocess.run(["open", path], check=True)
             else:  # Linux
                 subprocess.run(["xdg-open", path], check=True)
-        except Exception as e:
-            messagebox.showerror("Failed to open folder", str(e))
 
-    def _get_shot_details(self, frame_path: str) -> dict:
-        """Get details for a shot from oiiotool."""
-        if not self.oiiotool or not os.path.exists(frame_path):
-            return {}
-        try:
-            result = subprocess.run(
-                [self.oiiotool, frame_path, "--info", "-v"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                check=True
-            )
-            output = result.stdout
-            details = {}
-            for line in output.splitlines():
-                if "compression:" in line:
-                    details["compression"] = line.split("compression:")[1].strip().strip('"')
-                if "resolution:" in line:
-                    details["resolution"] = line.split("resolution:")[1].strip()
-                if "file size:" in line:
-                    details["filesize"] = line.split("file size:")[1].strip()
-            return details
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return {}
+        self._run_in_background(open_path, error_title="Failed to open folder")
+
+    def _coarse_thumbnail(self, frame: str) -> tuple | None:
+        """The frame's embedded EXR preview, to be zoomed towards thumbnail size.
 
-    def _make_thumbnail(self, frame: str) -> tk.PhotoImage | None:
+        ``None`` if the frame has none, or its thumbnail is already cached
+        and will show without a render anyway.
+        """
         try:
-            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-                tmp_path = tmp.name
-            cmd = [self.oiiotool, frame, "--resize", "200x200", "-o", tmp_path]
-            subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
-            img = tk.PhotoImage(file=tmp_path)
-            os.unlink(tmp_path)
-            return img
-        except Exception:
+            st = os.stat(frame)
+        except OSError:
             return None
-
-    def _get_channels(self, frame: str) -> List[str]:
-        if not self.oiiotool:
-            return []
+        key = (frame, st.st_mtime_ns, st.st_size)
+        if key in self._thumb_cache or os.path.exists(_thumbnail_cache_path(*key)):
+            return None
+        ppm = read_exr_preview(frame)
+        return (None, ppm, True) if ppm else None
+
+    def _thumbnail_and_info(self, frame: str) -> tuple[tuple | None, List[str], dict]:
+        """Thumbnail, channel list and details for ``frame`` from one oiiotool run.
+
+        The thumbnail is a ``(key, png_bytes, zoom)`` tuple for
+        ``_photo_image``; the PNG is skipped when the main thread already
+        holds the decoded image.
+        """
+        if not self.oiiotool and oiio is None:
+            # No thumbnail, but the header still describes the frame.
+            channels, details = read_exr_header(frame) or ([], {})
+            return None, channels, details
         try:
-            result = subprocess.run(
-                [self.oiiotool, frame, "--info", "-v"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-            )
-        except FileNotFoundError:
-            return []
-        for line in result.stdout.splitlines():
-            if "channel list:" in line:
-                return [c.strip() for c in line.split("channel list:", 1)[1].split(",")]
-        return []
+            st = os.stat(frame)
+        except OSError:
+            return None, [], {}
+        key = (frame, st.st_mtime_ns, st.st_size)
+        if self.oiiotool:
+            png, channels, details = _probe_frame(self.oiiotool, *key)
+        else:
+            channels, details = read_exr_header(frame) or ([], {})
+            png = None if key in self._thumb_cache else _thumbnail_oiio(*key, _preview_channels(channels))
+        return (key, png, False), list(channels), dict(details)
 
     def preview_channel(self) -> None:
         sel = self.layers_list.curselection()
         if not sel or not self.current_frame:
             return
         channel = self.layers_list.get(sel[0])
-        try:
-            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-                tmp_path = tmp.name
-            cmd = [self.oiiotool, self.current_frame, "-ch", channel,
-                   "--resize", "200x200", "-o", tmp_path]
-            subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
-            img = tk.PhotoImage(file=tmp_path)
-            os.unlink(tmp_path)
-            self.thumbnail = img
-            self.thumb_label.configure(image=self.thumbnail)
-        except Exception as e:
-            messagebox.showerror("Preview failed", str(e))
+        frame = self.current_frame
+        oiiotool = self.oiiotool
+
+        def render() -> None:
+            png = render_thumbnail(oiiotool, frame, channel)
+            self.queue.put(("channel_preview", frame, png))
+
+        self._run_in_background(render, error_title="Preview failed")
 
     # Single frame -------------------------------------------------------
     def convert_single(self) -> None:
-        file = filedialog.askopenfilename(
-            title="Select EXR frame", filetypes=[("OpenEXR", "*.exr")]
+        files = filedialog.askopenfilenames(
+            title="Select EXR frames", filetypes=[("OpenEXR", "*.exr *.EXR")]
         )
-        if not file:
+        if not files:
             return
-        oiiotool = find_oiiotool()
-        if not oiiotool:
+        oiiotool = self._current_oiiotool()
+        if not oiiotool and oiio is None:
             messagebox.showerror(
                 "Missing dependency",
                 "Could not find oiiotool executable.\nPlease install OpenImageIO tools.",
             )
             return
-        out = file.replace(".exr", "_SBS.exr")
-        cmd = [
-            oiiotool,
-            file,
-            "--fullpixels",
-            "-d",
-            self.datatype.get(),
-            "--compression",
-            self.compression.get(),
-            "-o",
-            out,
-        ]
-        try:
-            result = subprocess.run(
-                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-            )
-        except FileNotFoundError:
-            messagebox.showerror(
-                "Conversion failed",
-                "oiiotool executable not found. Please install OpenImageIO tools.",
-            )
-            return
-        if result.returncode != 0:
-            messagebox.showerror("Conversion failed", result.stderr.strip())
-            self.log.insert(tk.END, f"{os.path.basename(file)} failed - {result.stderr.strip()}\n")
-        else:
-            messagebox.showinfo("Conversion complete", f"Saved {out}")
-            self.log.insert(tk.END, f"Converted {os.path.basename(file)}\n")
-        self.log.see(tk.END)
+        # Convert in the background so the window stays responsive.
+        threading.Thread(
+            target=self._convert_files_worker,
+            args=(list(files), oiiotool),
+            daemon=True,
+        ).start()
+
+    def _convert_files_worker(self, files: List[str], oiiotool: str | None) -> None:
+        """Convert individually picked frames, several at a time."""
+        datatype, compression = self._snapshot_opts()
+        threads = max(1, self.oiio_threads.get())
+        env = {**os.environ, "OPENIMAGEIO_THREADS": str(threads)}
+
+        def run(file: str) -> tuple[str, str, str, bool]:
+            """Returns ``(file, out, error, streamed)``; ``streamed`` means
+            the error text has already been logged line by line."""
+            out = sbs_frame_name(file)
+            temp_out = part_name(out)
+            codec = resolve_compression(compression, file)
+            tail: deque = deque(maxlen=20)
+            renamed = False
+            try:
+                if oiio is not None:
+                    error = convert_frame_oiio(file, temp_out, datatype, codec)
+                else:
+                    # Stream stderr into the log as it arrives rather than
+                    # buffering it all until oiiotool exits; only the tail
+                    # is kept for the error message.
+                    proc = subprocess.Popen(
+                        [oiiotool, "--threads", str(threads), file, "--fullpixels",
+                         "-d", datatype, "--compression", codec, "-o", temp_out],
+                        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, bufsize=1, env=env,
+                        # Paths in the messages are UTF-8, not the locale
+                        # codec (cp1252 on Windows).
+                        encoding="utf-8", errors="replace",
+                    )
+                    with proc.stderr:
+                        for line in proc.stderr:
+                            line = line.rstrip()
+                            if line:
+                                tail.append(line)
+                                self.queue.put(("log", f"{os.path.basename(file)}: {line}"))
+                    returncode = proc.wait()
+                    error = ""
+                    if returncode != 0:
+                        error = "\n".join(tail) or f"oiiotool exited with {returncode}"
+                if not error:
+                    os.replace(temp_out, out)
+                    renamed = True
+            except Exception as e:
+                # Reported per file, so one bad frame can't stop the rest
+                # (or the completion dialog).
+                error = str(e) or type(e).__name__
+            finally:
+                if not renamed:
+                    try:
+                        os.unlink(temp_out)
+                    except OSError:
+                        pass
+            return file, out, error, bool(tail)
+
+        saved, failed = [], []
+        with ThreadPoolExecutor(max_workers=min(len(files), self._job_count())) as executor:
+            for file, out, error, streamed in executor.map(run, files):
+                if error:
+                    failed.append(f"{os.path.basename(file)}: {error}")
+                    self.queue.put(("log", f"{os.path.basename(file)} failed" + ("" if streamed else f" - {error}")))
+                else:
+                    saved.append(out)
+                    self.queue.put(("log", f"Converted {os.path.basename(file)}"))
+        self.queue.put(("single_done", saved, failed))
 
     def save_log(self) -> None:
         file = filedialog.asksaveasfilename(title="Save Log", defaultextension=".txt",
@@ -1161,20 +2654,98 @@ class ConverterGUI(tk.Tk):
         if not file:
             return
         with open(file, "w", encoding="utf-8") as fh:
-            fh.write(self.log.get("1.0", tk.END))
+            fh.write("\n".join(self._log_ring) + "\n")
 
     # Queue processing ----------------------------------------------------
+    def _make_queue(self) -> queue.Queue:
+        """Create the worker -> GUI message queue.
+
+        On POSIX the queue notifies Tk through a pipe, so nothing runs while
+        the app is idle. Windows Tk can't watch pipes; there a helper thread
+        posts a ``<<QueueReady>>`` event instead, which needs a thread-aware
+        Tcl. Without either, ``process_queue`` keeps polling.
+        """
+        self._queue_notified = False
+        self._queue_scheduled = False
+        self._queue_last_run = 0.0
+        if os.name != "posix":
+            if not self.tk.call("info", "exists", "tcl_platform(threaded)"):
+                return queue.Queue()
+            q = _SignallingQueue()
+            self.bind("<<QueueReady>>", lambda event: self._schedule_queue_run())
+            threading.Thread(target=self._pump_queue_events, args=(q.ready,), daemon=True).start()
+            self._queue_notified = True
+            return q
+        try:
+            read_fd, write_fd = os.pipe()
+            os.set_blocking(read_fd, False)
+            os.set_blocking(write_fd, False)
+            self.tk.createfilehandler(read_fd, tk.READABLE, self._on_queue_ready)
+        except (OSError, AttributeError, tk.TclError):
+            return queue.Queue()
+        self._queue_notified = True
+        return _NotifyingQueue(write_fd)
+
+    def _on_queue_ready(self, fd: int, mask: int) -> None:
+        """Messages arrived: schedule one drain, at most MAX_UPDATE_HZ a second."""
+        try:
+            while os.read(fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        self._schedule_queue_run()
+
+    def _pump_queue_events(self, ready: threading.Event) -> None:
+        """Turn queue puts into ``<<QueueReady>>`` events (helper thread).
+
+        A threaded Tcl runs ``event_generate`` from here on the Tk thread.
+        Before the main loop starts it raises ``RuntimeError``; the wakeup
+        is then kept and retried.
+        """
+        while True:
+            ready.wait()
+            ready.clear()
+            try:
+                self.event_generate("<<QueueReady>>", when="tail")
+            except RuntimeError:
+                ready.set()
+                time.sleep(0.1)
+            except tk.TclError:
+                return  # Window destroyed.
+
+    def _schedule_queue_run(self) -> None:
+        """Schedule one drain of the queue, at most MAX_UPDATE_HZ a second."""
+        if self._queue_scheduled:
+            return
+        self._queue_scheduled = True
+        wait = 1.0 / self.MAX_UPDATE_HZ - (time.monotonic() - self._queue_last_run)
+        self.after(max(0, int(wait * 1000)), self._run_notified_queue)
+
+    def _run_notified_queue(self) -> None:
+        self._queue_scheduled = False
+        self._queue_last_run = time.monotonic()
+        self.process_queue()
+
     def process_queue(self) -> None:
+        # Drain everything that is pending, but only apply the newest
+        # progress values and insert all log lines at once, so a busy
+        # worker costs a handful of widget updates per tick.
+        latest: Dict[str, tuple] = {}
+        log_lines: List[str] = []
+        # Dialogs are shown after the drain: a modal runs a nested event
+        # loop that could re-enter process_queue halfway through it.
+        dialogs: List[tuple] = []
+        handled = 0
         try:
-            while True:
+            while handled < self.MAX_MESSAGES_PER_RUN:
                 msg = self.queue.get_nowait()
+                handled += 1
                 if msg[0] == "scan_started":
                     self.scanning = True
                     self.load_folder_btn.config(state=tk.DISABLED)
                     self.refresh_btn.config(state=tk.DISABLED)
-                    for child in self.shots_inner.winfo_children():
-                        child.destroy()
-                    ttk.Label(self.shots_inner, text="Scanning...").pack(pady=10)
+                    if not self._shot_rows:
+                        self._set_shots_placeholder("Scanning...")
                 elif msg[0] == "scan_finished":
                     self.scanning = False
                     self.load_folder_btn.config(state=tk.NORMAL)
@@ -1183,50 +2754,105 @@ class ConverterGUI(tk.Tk):
                     self._update_shot_list(shots)
                     if self.live_mode_active.get():
                         self._handle_auto_processing(shots)
-                elif msg[0] == "shot":
-                    _, name, done, total = msg
-                    self.shot_label.config(text=f"{name}: {done}/{total}")
-                    self.shot_pb.configure(maximum=total, value=done)
-                elif msg[0] == "overall":
-                    _, done, total = msg
-                    self.overall_label.config(text=f"Overall: {done}/{total}")
-                    self.overall_pb.configure(maximum=total, value=done)
+                elif msg[0] in ("shot", "overall", "eta", "cpu"):
+                    latest[msg[0]] = msg
                 elif msg[0] == "log":
-                    _, text = msg
-                    self.log.insert(tk.END, text + "\n")
-                    self.log.see(tk.END)
-                elif msg[0] == "eta":
-                    _, remaining = msg
-                    self.eta_label.config(text=f"ETA: {self._format_time(remaining)}")
-                elif msg[0] == "cpu":
-                    _, percent = msg
-                    if os.cpu_count():
-                        threads = percent / 100 * os.cpu_count()
-                        self.cpu_label.config(text=f"CPU: {percent:.0f}% (~{threads:.1f} threads)")
+                    log_lines.append(msg[1])
+                elif msg[0] == "log_batch":
+                    log_lines.extend(msg[1])
+                elif msg[0] == "single_done":
+                    _, saved, failed = msg
+                    if failed:
+                        dialogs.append((messagebox.showerror, "Conversion failed", "\n".join(failed)))
+                    elif len(saved) == 1:
+                        dialogs.append((messagebox.showinfo, "Conversion complete", f"Saved {saved[0]}"))
                     else:
-                        self.cpu_label.config(text=f"CPU: {percent:.0f}%")
-                elif msg[0] == "done":
-                    self.convert_btn.config(state=tk.NORMAL)
+                        dialogs.append((messagebox.showinfo, "Conversion complete", f"Saved {len(saved)} frames."))
+                elif msg[0] == "channel_preview":
+                    # Dropped if another shot was selected meanwhile.
+                    if msg[1] == self.current_frame:
+                        image = self._photo_image((None, msg[2], False))
+                        if image is not None:
+                            self.thumbnail = image
+                            self.thumb_label.configure(image=self.thumbnail)
+                elif msg[0] == "preview_buttons":
+                    self._show_preview_buttons(*msg[1:])
                 elif msg[0] == "preview_update":
-                    _, thumbnail, channels, shot, frame_path = msg
-                    self._update_preview_ui(thumbnail, channels, shot, frame_path)
+                    _, thumbnail, channels, shot, frame_path, details = msg
+                    self._update_preview_ui(thumbnail, channels, shot, frame_path, details)
                 elif msg[0] == "refresh_request":
                     self.refresh_folder()
+                elif msg[0] == "error":
+                    dialogs.append((messagebox.showerror, msg[1], msg[2]))
+                elif msg[0] == "live_tick":
+                    if self.live_mode_active.get() and not self.scanning:
+                        self._handle_auto_processing(self.shots)
         except queue.Empty:
             pass
-        self.after(100, self.process_queue)
+
+        # Skip widget writes for values that are already on screen.
+        for kind, msg in list(latest.items()):
+            if self._applied_progress.get(kind) == msg:
+                del latest[kind]
+            else:
+                self._applied_progress[kind] = msg
+
+        if "shot" in latest:
+            _, name, done, total = latest["shot"]
+            self.shot_label.config(text=f"{name}: {done}/{total}")
+            self.shot_pb.configure(maximum=total, value=done)
+        if "overall" in latest:
+            _, done, total = latest["overall"]
+            self.overall_label.config(text=f"Overall: {done}/{total}")
+            self.overall_pb.configure(maximum=total, value=done)
+        if log_lines:
+            # A burst longer than the cap only needs its tail inserted.
+            log_lines = log_lines[-LOG_MAX_LINES:]
+            self._log_ring.extend(log_lines)
+            self.log.configure(state=tk.NORMAL)
+            self.log.insert(tk.END, "\n".join(log_lines) + "\n")
+            # Keep the widget bounded; a huge Text gets slow to update.
+            line_count = int(self.log.index("end-1c").split(".")[0])
+            if line_count > LOG_MAX_LINES:
+                self.log.delete("1.0", f"{line_count - LOG_MAX_LINES}.0")
+            self.log.configure(state=tk.DISABLED)
+            self.log.see(tk.END)
+        if "eta" in latest:
+            _, remaining = latest["eta"]
+            self.eta_label.config(text=f"ETA: {self._format_time(remaining)}")
+        if "cpu" in latest:
+            _, percent = latest["cpu"]
+            if os.cpu_count():
+                threads = percent / 100 * os.cpu_count()
+                self.cpu_label.config(text=f"CPU: {percent:.0f}% (~{threads:.1f} threads)")
+            else:
+                self.cpu_label.config(text=f"CPU: {percent:.0f}%")
+        for show, title, text in dialogs:
+            self.after_idle(show, title, text)
+        # Poll quickly while messages are flowing and back off when idle.
+        if self._queue_notified and handled < self.MAX_MESSAGES_PER_RUN:
+            return  # The next put schedules the next run.
+        delay = int(1000 / self.MAX_UPDATE_HZ) if handled else self.IDLE_POLL_MS
+        self.after(delay, self.process_queue)
 
 
 if __name__ == "__main__":
     import argparse
 
+    # The scan worker process re-enters here in a frozen (PyInstaller) build.
+    multiprocessing.freeze_support()
+
     parser = argparse.ArgumentParser(description="SBS EXR Converter GUI")
     parser.add_argument("--scan-only", dest="scan_only", help="Scan folder and print shot status")
+    parser.add_argument("--comp", default=DEFAULT_READY_FOR_COMP, help="'Ready For Comp' folder used with --scan-only")
+    parser.add_argument("--workers", type=int, default=SCAN_WORKERS,
+                        help=f"Shot folders scanned in parallel with --scan-only (default {SCAN_WORKERS})")
     args = parser.parse_args()
     if args.scan_only:
-        shots = scan_shots(args.scan_only)
-        for s in shots:
-            print(f"{s.name}: {'has SBS' if s.has_sbs else 'needs conversion'}")
+        shots = scan_shots(args.scan_only, args.comp, workers=args.workers)
+        # One write for the whole report instead of a print per shot.
+        report = "".join(f"{s.name}: {'has SBS' if s.has_sbs else 'needs conversion'}\n" for s in shots)
+        sys.stdout.write(report)
     else:
         app = ConverterGUI()
         app.mainloop()